@@ -0,0 +1,47 @@
+"""Add trigram indexes for alert message and docker event container lookups
+
+Revision ID: 1a6c8d3f5b27
+Revises: e7f3a9c21d64
+Create Date: 2026-10-16 15:04:46.271935
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a6c8d3f5b27'
+down_revision = 'e7f3a9c21d64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serve the ILIKE '%...%' lookups in the investigation handlers
+    # (container_logs.message already has idx_container_logs_message_gin)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_alerts_message_trgm',
+            'alerts',
+            ['message'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'message': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_docker_events_container_trgm',
+            'docker_events',
+            ['container'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'container': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_docker_events_container_trgm', table_name='docker_events', postgresql_concurrently=True)
+        op.drop_index('idx_alerts_message_trgm', table_name='alerts', postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""Add container_logs keyset pagination index
+
+Revision ID: 3b7d2e91c4a5
+Revises: fcc606ae3910
+Create Date: 2026-10-16 10:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7d2e91c4a5'
+down_revision = 'fcc606ae3910'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs the (timestamp, id) < (:ts, :id) ORDER BY timestamp DESC, id DESC
+    # page queries in the log fetch helpers
+    op.create_index(
+        'idx_container_logs_timestamp_id_desc',
+        'container_logs',
+        [sa.text('timestamp DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_container_logs_timestamp_id_desc', table_name='container_logs')
@@ -0,0 +1,35 @@
+"""Add partial index for high severity alerts
+
+Revision ID: 5d2b7e9a4c18
+Revises: 1a6c8d3f5b27
+Create Date: 2026-10-16 17:42:13.508236
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2b7e9a4c18'
+down_revision = '1a6c8d3f5b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serve the newest-HIGH-alerts lookups without touching other severities
+    # (unresolved alerts already have idx_alerts_unresolved_timestamp)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_alerts_high_severity_timestamp',
+            'alerts',
+            ['timestamp'],
+            unique=False,
+            postgresql_where=sa.text("severity = 'HIGH'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_alerts_high_severity_timestamp', table_name='alerts', postgresql_concurrently=True)
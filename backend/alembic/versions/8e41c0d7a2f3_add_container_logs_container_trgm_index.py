@@ -0,0 +1,37 @@
+"""Add trigram index on container_logs.container
+
+Revision ID: 8e41c0d7a2f3
+Revises: 3b7d2e91c4a5
+Create Date: 2026-10-16 11:02:17.845310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e41c0d7a2f3'
+down_revision = '3b7d2e91c4a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Lets container ILIKE '%name%' lookups use a bitmap index scan; message
+    # already has idx_container_logs_message_gin from the initial migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_container_logs_container_trgm',
+            'container_logs',
+            ['container'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'container': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_container_logs_container_trgm', table_name='container_logs', postgresql_concurrently=True)
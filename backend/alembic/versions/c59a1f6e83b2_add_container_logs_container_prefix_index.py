@@ -0,0 +1,30 @@
+"""Add prefix index on lower(container_logs.container)
+
+Revision ID: c59a1f6e83b2
+Revises: 8e41c0d7a2f3
+Create Date: 2026-10-16 11:40:53.102774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c59a1f6e83b2'
+down_revision = '8e41c0d7a2f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves lower(container) LIKE 'prefix%' as a B-Tree range scan regardless of collation
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_container_logs_container_pattern "
+            "ON container_logs (lower(container) text_pattern_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_container_logs_container_pattern")
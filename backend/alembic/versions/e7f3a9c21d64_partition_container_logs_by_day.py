@@ -0,0 +1,96 @@
+"""Partition container_logs by day on timestamp
+
+Revision ID: e7f3a9c21d64
+Revises: c59a1f6e83b2
+Create Date: 2026-10-16 13:25:08.617392
+
+Requires downtime: upgrade and downgrade both copy every container_logs row
+in a single transaction, holding an exclusive lock on the table throughout.
+Stop log ingestion (or schedule a maintenance window sized to the table)
+before running either direction. Verify upgrade and downgrade against a
+copy of production PostgreSQL first; this migration cannot run on SQLite.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7f3a9c21d64'
+down_revision = 'c59a1f6e83b2'
+branch_labels = None
+depends_on = None
+
+
+# Daily partitions are pre-created this many days ahead; the application
+# tops them up on startup and daily (see database.ensure_container_logs_partitions)
+PARTITION_DAYS_AHEAD = 7
+
+
+def _create_container_logs_indexes() -> None:
+    """Create the container_logs indexes; on a partitioned table they cascade to every partition."""
+    op.create_index('idx_container_logs_container_timestamp', 'container_logs', ['container', 'timestamp'], unique=False)
+    op.create_index('idx_container_logs_message_gin', 'container_logs', ['message'], unique=False, postgresql_using='gin', postgresql_ops={'message': 'gin_trgm_ops'})
+    op.create_index('idx_container_logs_timestamp_desc', 'container_logs', ['timestamp'], unique=False, postgresql_using='btree')
+    op.create_index(op.f('ix_container_logs_container'), 'container_logs', ['container'], unique=False)
+    op.create_index(op.f('ix_container_logs_timestamp'), 'container_logs', ['timestamp'], unique=False)
+    op.create_index('idx_container_logs_timestamp_id_desc', 'container_logs', [sa.text('timestamp DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('idx_container_logs_container_trgm', 'container_logs', ['container'], unique=False, postgresql_using='gin', postgresql_ops={'container': 'gin_trgm_ops'})
+    op.execute("CREATE INDEX idx_container_logs_container_pattern ON container_logs (lower(container) text_pattern_ops)")
+
+
+def upgrade() -> None:
+    # Build a partitioned copy of the table and move the rows across. The id
+    # sequence is re-owned by the new table so dropping the old one keeps it.
+    # The rename takes an ACCESS EXCLUSIVE lock that is held until the copy
+    # below commits, so writers block for the whole migration.
+    op.execute("ALTER TABLE container_logs RENAME TO container_logs_unpartitioned")
+    op.execute("ALTER TABLE container_logs_unpartitioned RENAME CONSTRAINT container_logs_pkey TO container_logs_unpartitioned_pkey")
+    op.execute(
+        "CREATE TABLE container_logs (LIKE container_logs_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("ALTER TABLE container_logs ADD PRIMARY KEY (id, timestamp)")
+    op.execute("ALTER SEQUENCE container_logs_id_seq OWNED BY container_logs.id")
+    
+    # Catch-all for rows outside the pre-created daily range
+    op.execute("CREATE TABLE container_logs_default PARTITION OF container_logs DEFAULT")
+    
+    # One partition per day from the oldest existing row through the look-ahead window
+    op.execute(f"""
+        DO $$
+        DECLARE
+            day date;
+        BEGIN
+            FOR day IN
+                SELECT generate_series(
+                    COALESCE((SELECT min(timestamp)::date FROM container_logs_unpartitioned), current_date),
+                    current_date + {PARTITION_DAYS_AHEAD},
+                    interval '1 day'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF container_logs FOR VALUES FROM (%L) TO (%L)',
+                    'container_logs_p' || to_char(day, 'YYYYMMDD'), day, day + 1
+                );
+            END LOOP;
+        END
+        $$;
+    """)
+    
+    op.execute("INSERT INTO container_logs SELECT * FROM container_logs_unpartitioned")
+    op.execute("DROP TABLE container_logs_unpartitioned")
+    _create_container_logs_indexes()
+    op.execute("ANALYZE container_logs")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE container_logs RENAME TO container_logs_partitioned")
+    op.execute("ALTER TABLE container_logs_partitioned RENAME CONSTRAINT container_logs_pkey TO container_logs_partitioned_pkey")
+    op.execute("CREATE TABLE container_logs (LIKE container_logs_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE container_logs ADD PRIMARY KEY (id)")
+    op.execute("ALTER SEQUENCE container_logs_id_seq OWNED BY container_logs.id")
+    op.execute("INSERT INTO container_logs SELECT * FROM container_logs_partitioned")
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE container_logs_partitioned")
+    _create_container_logs_indexes()
@@ -3,6 +3,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from sqlalchemy import text, create_engine
+from datetime import timedelta
 from typing import AsyncGenerator
 
 logger = logging.getLogger("monitoring-backend")
@@ -57,6 +58,7 @@ sync_engine = create_engine(
     pool_size=5,
     max_overflow=10,
     pool_timeout=30,
+    query_cache_size=500,  # compiled statement cache backing the NLP fetch helpers
     connect_args={
         "application_name": "monitoring-backend-sync",
     }
@@ -121,6 +123,9 @@ async def init_db():
         
         # Only create required extensions, not indexes (handled by migrations)
         await _create_required_extensions(conn)
+        
+        # Make sure upcoming days have a container_logs partition to land in
+        await ensure_container_logs_partitions(conn)
 
 
 async def _create_required_extensions(conn):
@@ -144,6 +149,90 @@ async def _create_required_extensions(conn):
             # Continue with other extensions
 
 
+async def ensure_container_logs_partitions(conn, days_ahead: int = 7):
+    """
+    Create the daily container_logs partitions for yesterday through days_ahead.
+    
+    Partitions that already exist are left alone, and nothing happens if the
+    table is not partitioned (i.e. the partitioning migration has not run).
+    Rows outside the created range land in the default partition; when a
+    missing day already has rows there, they are moved into its new partition.
+    
+    Args:
+        conn: Async connection to run the DDL on
+        days_ahead: Number of future days to pre-create partitions for
+    """
+    result = await conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('container_logs')"
+    ))
+    if result.first() is None:
+        return
+    
+    # Every worker runs this on startup and on schedule; serialize them
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('container_logs_partitions'))"))
+    await conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS container_logs_default PARTITION OF container_logs DEFAULT"
+    ))
+    
+    result = await conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'container_logs'::regclass"
+    ))
+    existing = set(result.scalars())
+    
+    # Take the days from the database so the bounds follow its session TimeZone,
+    # as the partitioning migration's current_date does, not the app host's clock
+    result = await conn.execute(
+        text("SELECT current_date + n FROM generate_series(-1, :days_ahead) AS n"),
+        {"days_ahead": days_ahead}
+    )
+    for day in result.scalars().all():
+        partition = f"container_logs_p{day:%Y%m%d}"
+        if partition in existing:
+            continue
+        next_day = day + timedelta(days=1)
+        bounds = {"day": day, "next_day": next_day}
+        in_day = "timestamp >= CAST(:day AS date) AND timestamp < CAST(:next_day AS date)"
+        # DDL takes no bind parameters; the bounds are formatted from date objects
+        create_sql = (
+            f"CREATE TABLE {partition} PARTITION OF container_logs "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{next_day.isoformat()}')"
+        )
+        try:
+            # Savepoint per partition so one failure doesn't abort the surrounding transaction
+            async with conn.begin_nested():
+                stranded = await conn.execute(
+                    text(f"SELECT 1 FROM container_logs_default WHERE {in_day} LIMIT 1"), bounds
+                )
+                if stranded.first() is None:
+                    await conn.execute(text(create_sql))
+                    continue
+                
+                # The new partition's range overlaps rows in the default partition, so
+                # detach it, create the partition, move the rows over and reattach.
+                # Detaching locks container_logs until the transaction commits.
+                logger.info(f"Moving {day.isoformat()} rows out of container_logs_default")
+                await conn.execute(text("ALTER TABLE container_logs DETACH PARTITION container_logs_default"))
+                await conn.execute(text(create_sql))
+                await conn.execute(
+                    text(f"INSERT INTO {partition} SELECT * FROM container_logs_default WHERE {in_day}"), bounds
+                )
+                await conn.execute(text(f"DELETE FROM container_logs_default WHERE {in_day}"), bounds)
+                await conn.execute(text("ALTER TABLE container_logs ATTACH PARTITION container_logs_default DEFAULT"))
+        except Exception as e:
+            logger.warning(f"Partition creation warning: {e}")
+
+
+async def maintain_container_logs_partitions():
+    """
+    Top up the container_logs partitions in a transaction of its own.
+    Called periodically by the application so long-running processes keep
+    creating tomorrow's partitions instead of filling the default one.
+    """
+    async with engine.begin() as conn:
+        await ensure_container_logs_partitions(conn)
+
+
 async def close_db():
     """
     Close database engines.
@@ -54,15 +54,19 @@ class ContainerLogsModel(Base):
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     container = Column(String(255), index=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Part of the primary key because the table is range-partitioned on it
+    timestamp = Column(DateTime(timezone=True), primary_key=True, nullable=False, index=True)
     message = Column(Text)
     
     # Indexes for efficient queries (excluding GIN index which is handled separately)
     __table_args__ = (
         Index('idx_container_logs_timestamp_desc', 'timestamp', postgresql_using='btree'),
         Index('idx_container_logs_container_timestamp', 'container', 'timestamp'),
+        Index('idx_container_logs_timestamp_id_desc', timestamp.desc(), id.desc()),
         # Note: GIN index for full-text search is created separately in database.py
         # to avoid duplicate index creation errors during startup
+        # Daily partitions are created by database.ensure_container_logs_partitions
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
 
 
@@ -97,6 +101,8 @@ class AlertsModel(Base):
         Index('idx_alerts_resolved', 'resolved'),
         Index('idx_alerts_unresolved_timestamp', 'resolved', 'timestamp', 
               postgresql_where='resolved = false'),
+        Index('idx_alerts_high_severity_timestamp', 'timestamp',
+              postgresql_where="severity = 'HIGH'"),
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -23,7 +24,7 @@ from services.email import send_alert_email, format_alert_email_content
 from services.rules import process_log_entry, get_alerts, add_alert
 from services.anomaly_detection import AnomalyDetectionService
 from rules_engine import analyze_request, get_stored_alerts
-from database import get_db_session, init_db, close_db
+from database import get_db_session, init_db, close_db, maintain_container_logs_partitions
 from performance_config import perf_config
 from db_models import (
     MetricsModel, DockerEventsModel, ContainerLogsModel, 
@@ -33,6 +34,13 @@ from routes import router as api_router
 from api.nlp_endpoints import nlp_router
 from api.analytics_endpoints import analytics_router
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    # orjson is optional; responses fall back to the stdlib json encoder
+    DefaultResponse = JSONResponse
+
 # Create logs directory if it doesn't exist
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
@@ -71,7 +79,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if os.getenv("ENVIRONMENT", "development") != "production" else None,
     redoc_url="/redoc" if os.getenv("ENVIRONMENT", "development") != "production" else None,
-    openapi_url="/openapi.json" if os.getenv("ENVIRONMENT", "development") != "production" else None
+    openapi_url="/openapi.json" if os.getenv("ENVIRONMENT", "development") != "production" else None,
+    default_response_class=DefaultResponse
 )
 
 # Add security middleware
@@ -109,17 +118,30 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+async def partition_maintenance_loop():
+    """Periodically create upcoming container_logs partitions."""
+    while True:
+        await asyncio.sleep(perf_config.PARTITION_MAINTENANCE_INTERVAL)
+        try:
+            await maintain_container_logs_partitions()
+        except Exception as e:
+            # Keep the loop alive; the next run retries the missing partitions
+            logger.error(f"Partition maintenance failed: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on application startup."""
     logger.info("Initializing database...")
     await init_db()
     logger.info("Database initialized successfully")
+    app.state.partition_maintenance_task = asyncio.create_task(partition_maintenance_loop())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up database connections on application shutdown."""
+    app.state.partition_maintenance_task.cancel()
     logger.info("Closing database connections...")
     await close_db()
     logger.info("Database connections closed")
@@ -26,6 +26,11 @@ class PerformanceConfig:
     # Caching settings
     ENABLE_RESPONSE_CACHE = os.getenv("ENABLE_RESPONSE_CACHE", "false").lower() == "true"
     CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # 5 minutes
+    LOG_COUNT_CACHE_TTL = int(os.getenv("LOG_COUNT_CACHE_TTL", "30"))  # 30 seconds
+    SECTION_CACHE_TTL = int(os.getenv("SECTION_CACHE_TTL", "60"))  # 1 minute
+    
+    # NLP query settings; parses below this confidence skip the database (0 disables the check)
+    NLP_MIN_QUERY_CONFIDENCE = float(os.getenv("NLP_MIN_QUERY_CONFIDENCE", "0"))
     
     # Rate limiting settings
     RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
@@ -40,6 +45,9 @@ class PerformanceConfig:
     BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
     BATCH_TIMEOUT = int(os.getenv("BATCH_TIMEOUT", "5"))  # 5 seconds
     
+    # Partition maintenance settings
+    PARTITION_MAINTENANCE_INTERVAL = int(os.getenv("PARTITION_MAINTENANCE_INTERVAL", "86400"))  # 1 day
+    
     @classmethod
     def get_uvicorn_config(cls) -> Dict[str, Any]:
         """Get UVicorn configuration for production."""
@@ -7,13 +7,32 @@ database queries for security monitoring, log analysis, and investigation tasks.
 
 import re
 import json
+import logging
+import threading
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from nlp_model import get_embedding
 
+try:
+    import re2
+except ImportError:
+    # google-re2 is optional; the stdlib engine is used when it is missing
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional; keyword matching falls back to substring checks
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
 
 class QueryIntent(Enum):
     """Types of query intents the system can handle."""
@@ -41,7 +60,7 @@ class EntityType(Enum):
     STATUS = "status"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractedEntity:
     """Represents an extracted entity from a query."""
     type: EntityType
@@ -50,16 +69,102 @@ class ExtractedEntity:
     original_text: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedQuery:
     """Represents a parsed natural language query."""
     intent: QueryIntent
-    entities: List[ExtractedEntity]
+    entities: Tuple[ExtractedEntity, ...]
     confidence: float
     original_query: str
     structured_params: Dict[str, Any]
 
 
+# Matches entity patterns that are a plain alternation of keywords
+_KEYWORD_ALTERNATION = re.compile(r'\\b\(\?:([\w|]+)\)\\b')
+
+# Cheap prefilters: IP addresses need a digit or a colon, clock times and dates a digit
+_DIGIT = re.compile(r'[0-9]')
+_NUMERIC_HINT = re.compile(r'[0-9:]')
+_NUMERIC_TIME_TYPES = frozenset(['specific_time', 'specific_date'])
+
+# Reads entity confidences in C when averaging them
+_entity_confidence = attrgetter('confidence')
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str, use_re2: bool = True):
+    """
+    Compile a pattern, preferring RE2's linear-time DFA engine.
+    
+    Patterns are matched against lowercased queries, so no case folding is
+    needed at match time. Patterns that RE2 cannot handle fall back to ``re``.
+    ``use_re2=False`` is for patterns that cannot backtrack badly, such as
+    literal alternations, where ``re`` outruns RE2's per-match binding overhead.
+    """
+    if use_re2 and re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def build_suggestion_index(suggestions: Sequence[str]) -> Dict[str, set]:
+    """
+    Map every substring of each suggestion word to the indices of the suggestions containing it.
+    
+    A whitespace-free query word occurs in a suggestion exactly when it is a
+    substring of one of its words, so one lookup replaces the per-suggestion scans.
+    """
+    index: Dict[str, set] = {}
+    for i, suggestion in enumerate(suggestions):
+        for word in suggestion.lower().split():
+            for start in range(len(word)):
+                for end in range(start + 1, len(word) + 1):
+                    index.setdefault(word[start:end], set()).add(i)
+    return index
+
+
+# Rolling time windows that end at the current time
+_RELATIVE_TIME_DELTAS = {
+    "last_hour": timedelta(hours=1),
+    "last_day": timedelta(days=1),
+    "last_week": timedelta(weeks=1),
+    "last_month": timedelta(days=30),
+}
+
+
+def _start_of_day(moment: datetime) -> datetime:
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _today_range(now: datetime) -> Dict[str, datetime]:
+    return {"start": _start_of_day(now), "end": now}
+
+
+def _yesterday_range(now: datetime) -> Dict[str, datetime]:
+    yesterday = now - timedelta(days=1)
+    end_of_yesterday = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return {"start": _start_of_day(yesterday), "end": end_of_yesterday}
+
+
+def _this_week_range(now: datetime) -> Dict[str, datetime]:
+    return {"start": _start_of_day(now - timedelta(days=now.weekday())), "end": now}
+
+
+def _this_month_range(now: datetime) -> Dict[str, datetime]:
+    return {"start": _start_of_day(now.replace(day=1)), "end": now}
+
+
+# Calendar-aligned time windows
+_CALENDAR_TIME_RANGES = {
+    "today": _today_range,
+    "yesterday": _yesterday_range,
+    "this_week": _this_week_range,
+    "this_month": _this_month_range,
+}
+
+
 class NLPQueryParser:
     """
     Advanced NLP query parser using sentence transformers and pattern matching.
@@ -68,22 +173,85 @@ class NLPQueryParser:
     robust natural language query processing.
     """
     
+    __slots__ = (
+        'intent_patterns', 'entity_patterns', 'entity_groups', 'capture_patterns',
+        'entity_keywords', 'entity_scanner', 'keyword_scanner', 'time_patterns', 'domain_indicators',
+        'keyword_intents', 'keyword_weights', 'intent_pattern_counts',
+        'question_words', 'time_terms', 'keywords', 'keyword_automaton',
+        'suggestions', 'suggestion_index',
+        'use_improved_classifier', 'improved_classifier', 'classifier_ready',
+    )
+    
     def __init__(self, use_improved_classifier: bool = True):
         """Initialize the NLP query parser with intent patterns and entity extractors."""
         self.intent_patterns = self._build_intent_patterns()
         self.entity_patterns = self._build_entity_patterns()
+        self.entity_scanner = self._build_entity_scanner()
         self.time_patterns = self._build_time_patterns()
+        self.domain_indicators = self._build_domain_indicators()
+        
+        # Map each keyword to the intents it scores so one scan serves all intents
+        self.keyword_intents: Dict[str, List[QueryIntent]] = {}
+        for intent, patterns in self.intent_patterns.items():
+            for pattern in patterns:
+                self.keyword_intents.setdefault(pattern, []).append(intent)
+        # Longer keywords weigh more; scores are normalized by each intent's pattern count
+        self.keyword_weights = {
+            keyword: len(keyword.split()) * 0.3 + 0.7 for keyword in self.keyword_intents
+        }
+        self.intent_pattern_counts = {
+            intent: len(patterns) for intent, patterns in self.intent_patterns.items()
+        }
+        self.question_words = frozenset(['why', 'what', 'how', 'when', 'where', 'who'])
+        self.time_terms = frozenset(['yesterday', 'today', 'last week', 'last month', 'recent', 'latest', 'current'])
+        self.keywords = (
+            frozenset(self.keyword_intents) | frozenset(self.domain_indicators)
+            | self.question_words | self.time_terms
+        )
+        self.keyword_automaton = self._build_keyword_automaton()
+        
+        self.suggestions = (
+            "Show me all failed logins in the last hour",
+            "Generate weekly security summary",
+            "What assets did IP address 192.168.1.100 target?",
+            "Show critical alerts from today",
+            "Find all ERROR logs from container webapp",
+            "Investigate suspicious activity in the last 24 hours",
+            "Generate monthly Docker events report",
+            "Show all unresolved high severity alerts",
+            "What containers had failures yesterday?",
+            "Analyze login trends this week"
+        )
+        self.suggestion_index = build_suggestion_index(self.suggestions)
+        
         self.use_improved_classifier = use_improved_classifier
+        self.improved_classifier = None
+        self.classifier_ready = threading.Event()
         
-        # Initialize improved classifier if enabled
+        # Load the improved classifier in the background so construction does not block on the model
         if self.use_improved_classifier:
-            try:
-                from services.improved_intent_classifier import get_improved_classifier
-                self.improved_classifier = get_improved_classifier()
-            except Exception as e:
-                print(f"Warning: Could not initialize improved classifier: {e}")
-                self.use_improved_classifier = False
-                self.improved_classifier = None
+            threading.Thread(target=self._load_improved_classifier, daemon=True).start()
+        else:
+            self.classifier_ready.set()
+    
+    def _load_improved_classifier(self):
+        """Load the improved classifier, disabling it if it cannot be initialized."""
+        try:
+            from services.improved_intent_classifier import get_improved_classifier
+            self.improved_classifier = get_improved_classifier()
+        except Exception as e:
+            logger.warning("Could not initialize improved classifier: %s", e)
+            self.use_improved_classifier = False
+            self.improved_classifier = None
+        finally:
+            self.classifier_ready.set()
+    
+    def _get_improved_classifier(self):
+        """Return the improved classifier, waiting for it to load; None when it is unavailable."""
+        if not self.use_improved_classifier:
+            return None
+        self.classifier_ready.wait()
+        return self.improved_classifier
         
     def _build_intent_patterns(self) -> Dict[QueryIntent, List[str]]:
         """Build patterns for intent classification with improved keywords."""
@@ -135,28 +303,33 @@ class NLPQueryParser:
             ]
         }
     
-    def _build_entity_patterns(self) -> Dict[EntityType, List[str]]:
-        """Build regex patterns for entity extraction."""
+    def _build_entity_patterns(self) -> Dict[EntityType, List[Any]]:
+        """Build compiled regex patterns for entity extraction; they expect lowercased input."""
+        return {
+            entity_type: [_compile_pattern(pattern) for pattern in type_patterns]
+            for entity_type, type_patterns in self._entity_pattern_sources().items()
+        }
+    
+    def _entity_pattern_sources(self) -> Dict[EntityType, List[str]]:
+        """Regex sources for entity extraction, in extraction order."""
         return {
             EntityType.IP_ADDRESS: [
                 r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b',
                 r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b'  # IPv6
             ],
             EntityType.LOG_LEVEL: [
-                r'\b(?:error|warn|warning|info|debug|trace|critical|fatal)\b',
-                r'\b(?:ERROR|WARN|WARNING|INFO|DEBUG|TRACE|CRITICAL|FATAL)\b'
+                r'\b(?:error|warn|warning|info|debug|trace|critical|fatal)\b'
             ],
             EntityType.EVENT_TYPE: [
                 r'\b(?:login|logout|authentication|access|connection|failure|success)\b',
                 r'\b(?:docker|container|service|application|database|network)\b'
             ],
             EntityType.CONTAINER_NAME: [
-                r'\b[a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9]\b(?=\s*container)',
+                r'\b([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])\s+container',
                 r'container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])'
             ],
             EntityType.SEVERITY: [
-                r'\b(?:low|medium|high|critical)\b',
-                r'\b(?:LOW|MEDIUM|HIGH|CRITICAL)\b'
+                r'\b(?:low|medium|high|critical)\b'
             ],
             EntityType.STATUS: [
                 r'\b(?:resolved|unresolved|open|closed|active|inactive)\b',
@@ -164,9 +337,52 @@ class NLPQueryParser:
             ]
         }
     
-    def _build_time_patterns(self) -> Dict[str, str]:
-        """Build patterns for time range extraction."""
-        return {
+    def _build_entity_scanner(self):
+        """
+        Fuse the entity patterns without a capture group into one alternation.
+        
+        Keyword patterns share a single ``keyword`` group backed by a word lookup,
+        because words such as "critical" belong to several entity types. Other
+        patterns get their own named group, so one ``finditer`` pass finds every
+        IP and keyword entity. Capturing patterns (container names) overlap the
+        text of other entities and keep their own pass. Every entry carries its
+        rank in extraction order so results keep the per-pattern ordering.
+        
+        Also sets ``keyword_scanner``, the keyword group alone, for queries that
+        cannot contain an IP address.
+        """
+        fused_sources = []
+        keywords: Dict[str, List[Tuple[int, EntityType]]] = {}
+        self.entity_groups: Dict[str, Tuple[int, EntityType]] = {}
+        self.capture_patterns: List[Tuple[int, EntityType, Any]] = []
+        
+        rank = 0
+        for entity_type, patterns in self._entity_pattern_sources().items():
+            for source, pattern in zip(patterns, self.entity_patterns[entity_type]):
+                literal = _KEYWORD_ALTERNATION.fullmatch(source)
+                if literal:
+                    for word in literal.group(1).split("|"):
+                        keywords.setdefault(word.lower(), []).append((rank, entity_type))
+                elif pattern.groups:
+                    self.capture_patterns.append((rank, entity_type, pattern))
+                else:
+                    name = f"e{rank}"
+                    fused_sources.append(f"(?P<{name}>{source})")
+                    self.entity_groups[name] = (rank, entity_type)
+                rank += 1
+        
+        self.entity_keywords = keywords
+        # Longest words first so an alternative never shadows a longer keyword
+        words = sorted(keywords, key=len, reverse=True)
+        keyword_source = r"(?P<keyword>\b(?:" + "|".join(words) + r")\b)"
+        # Literal words and bounded IP repeats are safe for the stdlib engine, which scans them faster
+        self.keyword_scanner = _compile_pattern(keyword_source, use_re2=False)
+        fused_sources.append(keyword_source)
+        return _compile_pattern("|".join(fused_sources), use_re2=False)
+    
+    def _build_time_patterns(self) -> Dict[str, Any]:
+        """Build compiled patterns for time range extraction."""
+        patterns = {
             'last_hour': r'\b(?:last|past)\s+hour\b',
             'last_day': r'\b(?:last|past)\s+(?:day|24\s*hours?)\b',
             'last_week': r'\b(?:last|past)\s+week\b',
@@ -178,6 +394,101 @@ class NLPQueryParser:
             'specific_time': r'\b\d{1,2}:\d{2}\b',
             'specific_date': r'\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}/\d{1,2}/\d{4}\b'
         }
+        return {time_type: _compile_pattern(pattern) for time_type, pattern in patterns.items()}
+    
+    def _build_domain_indicators(self) -> Dict[str, QueryIntent]:
+        """Build technical terms that strongly indicate specific intents."""
+        return {
+            # Log-related terms
+            'log': QueryIntent.SEARCH_LOGS,
+            'logs': QueryIntent.SEARCH_LOGS,
+            'logging': QueryIntent.SEARCH_LOGS,
+            'stdout': QueryIntent.SEARCH_LOGS,
+            'stderr': QueryIntent.SEARCH_LOGS,
+            'syslog': QueryIntent.SEARCH_LOGS,
+            'journal': QueryIntent.SEARCH_LOGS,
+            
+            # Alert-related terms
+            'alert': QueryIntent.SHOW_ALERTS,
+            'alerts': QueryIntent.SHOW_ALERTS,
+            'alarm': QueryIntent.SHOW_ALERTS,
+            'alarms': QueryIntent.SHOW_ALERTS,
+            'notification': QueryIntent.SHOW_ALERTS,
+            'incident': QueryIntent.SHOW_ALERTS,
+            'warning': QueryIntent.SHOW_ALERTS,
+            'critical': QueryIntent.SHOW_ALERTS,
+            
+            # Investigation terms
+            'debug': QueryIntent.INVESTIGATE,
+            'troubleshoot': QueryIntent.INVESTIGATE,
+            'diagnose': QueryIntent.INVESTIGATE,
+            'root cause': QueryIntent.INVESTIGATE,
+            'why': QueryIntent.INVESTIGATE,
+            'what happened': QueryIntent.INVESTIGATE,
+            'what caused': QueryIntent.INVESTIGATE,
+            
+            # Performance terms
+            'performance': QueryIntent.ANALYTICS_PERFORMANCE,
+            'cpu': QueryIntent.ANALYTICS_PERFORMANCE,
+            'memory': QueryIntent.ANALYTICS_PERFORMANCE,
+            'disk': QueryIntent.ANALYTICS_PERFORMANCE,
+            'network': QueryIntent.ANALYTICS_PERFORMANCE,
+            'latency': QueryIntent.ANALYTICS_PERFORMANCE,
+            'throughput': QueryIntent.ANALYTICS_PERFORMANCE,
+            'response time': QueryIntent.ANALYTICS_PERFORMANCE,
+            
+            # Metrics terms
+            'metrics': QueryIntent.ANALYTICS_METRICS,
+            'metric': QueryIntent.ANALYTICS_METRICS,
+            'kpi': QueryIntent.ANALYTICS_METRICS,
+            'measurement': QueryIntent.ANALYTICS_METRICS,
+            'statistics': QueryIntent.ANALYTICS_METRICS,
+            
+            # Anomaly terms
+            'anomaly': QueryIntent.ANALYTICS_ANOMALIES,
+            'anomalies': QueryIntent.ANALYTICS_ANOMALIES,
+            'unusual': QueryIntent.ANALYTICS_ANOMALIES,
+            'suspicious': QueryIntent.ANALYTICS_ANOMALIES,
+            'outlier': QueryIntent.ANALYTICS_ANOMALIES,
+            'abnormal': QueryIntent.ANALYTICS_ANOMALIES,
+            
+            # Trend terms
+            'trend': QueryIntent.ANALYZE_TRENDS,
+            'trends': QueryIntent.ANALYZE_TRENDS,
+            'pattern': QueryIntent.ANALYZE_TRENDS,
+            'patterns': QueryIntent.ANALYZE_TRENDS,
+            'over time': QueryIntent.ANALYZE_TRENDS,
+            'historical': QueryIntent.ANALYZE_TRENDS,
+            'compare': QueryIntent.ANALYZE_TRENDS,
+            
+            # Report terms
+            'report': QueryIntent.GENERATE_REPORT,
+            'generate': QueryIntent.GENERATE_REPORT,
+            'create': QueryIntent.GENERATE_REPORT,
+            'export': QueryIntent.GENERATE_REPORT,
+            'compile': QueryIntent.GENERATE_REPORT,
+            
+            # Summary terms
+            'summary': QueryIntent.ANALYTICS_SUMMARY,
+            'overview': QueryIntent.ANALYTICS_SUMMARY,
+            'status': QueryIntent.ANALYTICS_SUMMARY,
+            'dashboard': QueryIntent.ANALYTICS_SUMMARY,
+        }
+    
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton over all intent keywords and domain indicators.
+        
+        Returns None when pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self.keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
     
     def parse_query(self, query: str) -> ParsedQuery:
         """
@@ -189,34 +500,52 @@ class NLPQueryParser:
         Returns:
             ParsedQuery: Structured representation of the query
         """
+        return self._build_parsed_query(query, *self.analyze_query(query))
+    
+    def analyze_query(self, query: str) -> Tuple[QueryIntent, float, Tuple[ExtractedEntity, ...]]:
+        """
+        Classify a query and extract its entities.
+        
+        The result does not depend on the current time, so it can be cached per query string.
+        
+        Args:
+            query: The natural language query string
+            
+        Returns:
+            Tuple of intent, overall confidence and extracted entities
+        """
         query_lower = query.lower()
         
         # Classify intent using improved classifier if available
-        if self.use_improved_classifier and self.improved_classifier:
-            intent, intent_confidence = self.improved_classifier.classify_intent(query)
+        improved_classifier = self._get_improved_classifier()
+        if improved_classifier:
+            intent, intent_confidence = improved_classifier.classify_intent(query)
         else:
-            intent, intent_confidence = self._classify_intent(query_lower)
+            # No classifier to fall back from; score the already lowercased query directly
+            intent, intent_confidence = self._classify_with_keywords(query_lower)
         
         # Extract entities
-        entities = self._extract_entities(query)
+        entities = self._extract_entities(query, query_lower)
         
         # Extract time range
         time_entity = self._extract_time_range(query_lower)
         if time_entity:
             entities.append(time_entity)
         
-        # Build structured parameters
-        structured_params = self._build_structured_params(intent, entities)
-        
         # Calculate overall confidence
         overall_confidence = self._calculate_confidence(intent_confidence, entities)
         
+        return intent, overall_confidence, tuple(entities)
+    
+    def _build_parsed_query(self, query: str, intent: QueryIntent, confidence: float,
+                            entities: Tuple[ExtractedEntity, ...]) -> ParsedQuery:
+        """Assemble a ParsedQuery, resolving relative time ranges against the current time."""
         return ParsedQuery(
             intent=intent,
             entities=entities,
-            confidence=overall_confidence,
+            confidence=confidence,
             original_query=query,
-            structured_params=structured_params
+            structured_params=self._build_structured_params(intent, entities)
         )
     
     def _classify_intent(self, query: str) -> Tuple[QueryIntent, float]:
@@ -224,9 +553,10 @@ class NLPQueryParser:
         query_lower = query.lower()
         
         # Try improved classifier first if available
-        if self.use_improved_classifier and self.improved_classifier:
+        improved_classifier = self._get_improved_classifier()
+        if improved_classifier:
             try:
-                intent, confidence = self.improved_classifier.classify_intent(query)
+                intent, confidence = improved_classifier.classify_intent(query)
                 
                 # EMERGENCY FIX: Lower all thresholds aggressively
                 if confidence < 0.1:  # Only fallback if extremely low
@@ -243,7 +573,7 @@ class NLPQueryParser:
                 return intent, confidence
                 
             except Exception as e:
-                print(f"Error in improved classifier: {e}")
+                logger.warning("Error in improved classifier: %s", e)
                 # Fall back to keyword-based classification
                 return self._classify_with_keywords(query_lower)
         
@@ -252,30 +582,34 @@ class NLPQueryParser:
     
     def _classify_with_keywords(self, query_lower: str) -> Tuple[QueryIntent, float]:
         """Classify intent using keyword-based approach with improved scoring."""
-        intent_scores = {}
+        matched = self._match_keywords(query_lower)
+        scores: Dict[QueryIntent, float] = {}
+        counts: Dict[QueryIntent, int] = {}
+        
+        # Accumulate keyword hits for every intent the keyword belongs to
+        for keyword in matched:
+            intents = self.keyword_intents.get(keyword)
+            if not intents:
+                continue
+            pattern_weight = self.keyword_weights[keyword]
+            for intent in intents:
+                scores[intent] = scores.get(intent, 0) + pattern_weight
+                counts[intent] = counts.get(intent, 0) + 1
         
-        # Calculate scores for each intent based on keyword matches
-        for intent, patterns in self.intent_patterns.items():
-            score = 0
-            matched_keywords = 0
-            
-            for pattern in patterns:
-                if pattern in query_lower:
-                    # Weight longer patterns more heavily
-                    pattern_weight = len(pattern.split()) * 0.3 + 0.7
-                    score += pattern_weight
-                    matched_keywords += 1
+        intent_scores = {}
+        for intent, pattern_count in self.intent_pattern_counts.items():
+            matched_keywords = counts.get(intent, 0)
             
             # Normalize score by number of patterns and add bonus for multiple matches
             if matched_keywords > 0:
-                normalized_score = score / len(patterns)
+                normalized_score = scores[intent] / pattern_count
                 # Bonus for multiple keyword matches
                 if matched_keywords > 1:
                     normalized_score *= (1 + (matched_keywords - 1) * 0.2)
                 intent_scores[intent] = min(normalized_score, 1.0)
         
         # Special handling for domain-specific terms
-        domain_boost = self._get_domain_context_boost(query_lower)
+        domain_boost = self._get_domain_context_boost(query_lower, matched)
         for intent, boost in domain_boost.items():
             if intent in intent_scores:
                 intent_scores[intent] = min(intent_scores[intent] + boost, 1.0)
@@ -283,9 +617,11 @@ class NLPQueryParser:
         if not intent_scores:
             return QueryIntent.UNKNOWN, 0.0
         
-        # Get the best intent
-        best_intent = max(intent_scores, key=intent_scores.get)
-        confidence = intent_scores[best_intent]
+        # Get the best intent; ties keep the first intent, as max() did
+        best_intent, confidence = None, -1.0
+        for intent, score in intent_scores.items():
+            if score > confidence:
+                best_intent, confidence = intent, score
         
         # EMERGENCY FIX: Apply very low confidence thresholds
         if confidence < 0.05:
@@ -296,126 +632,90 @@ class NLPQueryParser:
         else:
             return best_intent, min(confidence, 0.9)
     
-    def _get_domain_context_boost(self, query_lower: str) -> Dict[QueryIntent, float]:
+    def _match_keywords(self, query_lower: str) -> set:
+        """Return every intent keyword, domain indicator and context term contained in the query."""
+        if self.keyword_automaton is not None:
+            return {keyword for _, keyword in self.keyword_automaton.iter(query_lower)}
+        return {keyword for keyword in self.keywords if keyword in query_lower}
+    
+    def _get_domain_context_boost(self, query_lower: str, matched: Optional[set] = None) -> Dict[QueryIntent, float]:
         """Provide domain-specific context boosts for better classification."""
         boosts = {}
+        if matched is None:
+            matched = self._match_keywords(query_lower)
         
-        # Technical terms that strongly indicate specific intents
-        technical_indicators = {
-            # Log-related terms
-            'log': QueryIntent.SEARCH_LOGS,
-            'logs': QueryIntent.SEARCH_LOGS,
-            'logging': QueryIntent.SEARCH_LOGS,
-            'stdout': QueryIntent.SEARCH_LOGS,
-            'stderr': QueryIntent.SEARCH_LOGS,
-            'syslog': QueryIntent.SEARCH_LOGS,
-            'journal': QueryIntent.SEARCH_LOGS,
-            
-            # Alert-related terms
-            'alert': QueryIntent.SHOW_ALERTS,
-            'alerts': QueryIntent.SHOW_ALERTS,
-            'alarm': QueryIntent.SHOW_ALERTS,
-            'alarms': QueryIntent.SHOW_ALERTS,
-            'notification': QueryIntent.SHOW_ALERTS,
-            'incident': QueryIntent.SHOW_ALERTS,
-            'warning': QueryIntent.SHOW_ALERTS,
-            'critical': QueryIntent.SHOW_ALERTS,
-            
-            # Investigation terms
-            'debug': QueryIntent.INVESTIGATE,
-            'troubleshoot': QueryIntent.INVESTIGATE,
-            'diagnose': QueryIntent.INVESTIGATE,
-            'root cause': QueryIntent.INVESTIGATE,
-            'why': QueryIntent.INVESTIGATE,
-            'what happened': QueryIntent.INVESTIGATE,
-            'what caused': QueryIntent.INVESTIGATE,
-            
-            # Performance terms
-            'performance': QueryIntent.ANALYTICS_PERFORMANCE,
-            'cpu': QueryIntent.ANALYTICS_PERFORMANCE,
-            'memory': QueryIntent.ANALYTICS_PERFORMANCE,
-            'disk': QueryIntent.ANALYTICS_PERFORMANCE,
-            'network': QueryIntent.ANALYTICS_PERFORMANCE,
-            'latency': QueryIntent.ANALYTICS_PERFORMANCE,
-            'throughput': QueryIntent.ANALYTICS_PERFORMANCE,
-            'response time': QueryIntent.ANALYTICS_PERFORMANCE,
-            
-            # Metrics terms
-            'metrics': QueryIntent.ANALYTICS_METRICS,
-            'metric': QueryIntent.ANALYTICS_METRICS,
-            'kpi': QueryIntent.ANALYTICS_METRICS,
-            'measurement': QueryIntent.ANALYTICS_METRICS,
-            'statistics': QueryIntent.ANALYTICS_METRICS,
-            
-            # Anomaly terms
-            'anomaly': QueryIntent.ANALYTICS_ANOMALIES,
-            'anomalies': QueryIntent.ANALYTICS_ANOMALIES,
-            'unusual': QueryIntent.ANALYTICS_ANOMALIES,
-            'suspicious': QueryIntent.ANALYTICS_ANOMALIES,
-            'outlier': QueryIntent.ANALYTICS_ANOMALIES,
-            'abnormal': QueryIntent.ANALYTICS_ANOMALIES,
-            
-            # Trend terms
-            'trend': QueryIntent.ANALYZE_TRENDS,
-            'trends': QueryIntent.ANALYZE_TRENDS,
-            'pattern': QueryIntent.ANALYZE_TRENDS,
-            'patterns': QueryIntent.ANALYZE_TRENDS,
-            'over time': QueryIntent.ANALYZE_TRENDS,
-            'historical': QueryIntent.ANALYZE_TRENDS,
-            'compare': QueryIntent.ANALYZE_TRENDS,
-            
-            # Report terms
-            'report': QueryIntent.GENERATE_REPORT,
-            'generate': QueryIntent.GENERATE_REPORT,
-            'create': QueryIntent.GENERATE_REPORT,
-            'export': QueryIntent.GENERATE_REPORT,
-            'compile': QueryIntent.GENERATE_REPORT,
-            
-            # Summary terms
-            'summary': QueryIntent.ANALYTICS_SUMMARY,
-            'overview': QueryIntent.ANALYTICS_SUMMARY,
-            'status': QueryIntent.ANALYTICS_SUMMARY,
-            'dashboard': QueryIntent.ANALYTICS_SUMMARY,
-        }
-        
-        for term, intent in technical_indicators.items():
-            if term in query_lower:
-                boosts[intent] = boosts.get(intent, 0) + 0.2
+        for term in matched & self.domain_indicators.keys():
+            intent = self.domain_indicators[term]
+            boosts[intent] = boosts.get(intent, 0) + 0.2
         
         # Question words that indicate investigation
-        question_words = ['why', 'what', 'how', 'when', 'where', 'who']
-        if any(word in query_lower for word in question_words):
+        if not matched.isdisjoint(self.question_words):
             boosts[QueryIntent.INVESTIGATE] = boosts.get(QueryIntent.INVESTIGATE, 0) + 0.15
         
         # Time-related terms that indicate trends
-        time_terms = ['yesterday', 'today', 'last week', 'last month', 'recent', 'latest', 'current']
-        if any(term in query_lower for term in time_terms):
+        if not matched.isdisjoint(self.time_terms):
             boosts[QueryIntent.ANALYZE_TRENDS] = boosts.get(QueryIntent.ANALYZE_TRENDS, 0) + 0.1
         
         return boosts
 
-    def _extract_entities(self, query: str) -> List[ExtractedEntity]:
-        """Extract entities from the query using pattern matching."""
-        entities = []
+    def _extract_entities(self, query: str, query_lower: Optional[str] = None) -> List[ExtractedEntity]:
+        """Extract entities from the lowercased query using pattern matching."""
+        if query_lower is None:
+            query_lower = query.lower()
+        # Spans line up with the original text unless lowercasing changed its length
+        original = query if len(query) == len(query_lower) else query_lower
+        matches = []
+        
+        # A single scan finds every IP and keyword entity; IP patterns need a digit or a colon
+        if _NUMERIC_HINT.search(query_lower):
+            scanner = self.entity_scanner
+        else:
+            scanner = self.keyword_scanner
+        for match in scanner.finditer(query_lower):
+            start, end = match.span()
+            if match.lastgroup == "keyword":
+                for rank, entity_type in self.entity_keywords[match.group()]:
+                    matches.append((rank, start, end, entity_type))
+            else:
+                rank, entity_type = self.entity_groups[match.lastgroup]
+                matches.append((rank, start, end, entity_type))
+        
+        for rank, entity_type, pattern in self.capture_patterns:
+            for match in pattern.finditer(query_lower):
+                # Patterns with a capture group only extract the captured part
+                start, end = match.span(1)
+                matches.append((rank, start, end, entity_type))
+        
+        # Keep the per-pattern extraction order so later filters still win;
+        # (rank, start) pairs are unique, so the entity types are never compared
+        matches.sort()
         
-        for entity_type, patterns in self.entity_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, query, re.IGNORECASE)
-                for match in matches:
-                    entity = ExtractedEntity(
-                        type=entity_type,
-                        value=match.group().lower(),
-                        confidence=0.9,  # High confidence for regex matches
-                        original_text=match.group()
-                    )
-                    entities.append(entity)
+        entities = []
+        seen = set()
+        for _, start, end, entity_type in matches:
+            # Drop same-type repeats of a span, e.g. "x" captured by both container patterns
+            # in "container x container"; other types on one span (log level and severity) stay
+            key = (entity_type, start, end)
+            if key in seen:
+                continue
+            seen.add(key)
+            entities.append(ExtractedEntity(
+                type=entity_type,
+                value=query_lower[start:end],
+                confidence=0.9,  # High confidence for regex matches
+                original_text=original[start:end]
+            ))
         
         return entities
     
     def _extract_time_range(self, query: str) -> Optional[ExtractedEntity]:
         """Extract time range from the query."""
+        has_digit = _DIGIT.search(query) is not None
         for time_type, pattern in self.time_patterns.items():
-            match = re.search(pattern, query, re.IGNORECASE)
+            # Clock times and dates cannot match without a digit
+            if not has_digit and time_type in _NUMERIC_TIME_TYPES:
+                continue
+            match = pattern.search(query)
             if match:
                 return ExtractedEntity(
                     type=EntityType.TIME_RANGE,
@@ -426,7 +726,7 @@ class NLPQueryParser:
         
         return None
     
-    def _build_structured_params(self, intent: QueryIntent, entities: List[ExtractedEntity]) -> Dict[str, Any]:
+    def _build_structured_params(self, intent: QueryIntent, entities: Tuple[ExtractedEntity, ...]) -> Dict[str, Any]:
         """Build structured parameters from intent and entities."""
         params = {
             "intent": intent.value,
@@ -435,9 +735,12 @@ class NLPQueryParser:
             "output_format": "json"
         }
         
+        # Resolve all relative time ranges against the same instant
+        now = datetime.now()
+        
         for entity in entities:
             if entity.type == EntityType.TIME_RANGE:
-                params["time_range"] = self._convert_time_range(entity.value)
+                params["time_range"] = self._convert_time_range(entity.value, now)
             elif entity.type == EntityType.IP_ADDRESS:
                 params["filters"]["ip_address"] = entity.value
             elif entity.type == EntityType.LOG_LEVEL:
@@ -453,89 +756,78 @@ class NLPQueryParser:
         
         return params
     
-    def _convert_time_range(self, time_value: str) -> Dict[str, datetime]:
-        """Convert time range string to datetime objects."""
-        now = datetime.now()
+    def _convert_time_range(self, time_value: str, now: Optional[datetime] = None) -> Dict[str, datetime]:
+        """Convert time range string to datetime objects relative to ``now``."""
+        if now is None:
+            now = datetime.now()
         
-        if time_value == "last_hour":
-            return {"start": now - timedelta(hours=1), "end": now}
-        elif time_value == "last_day":
-            return {"start": now - timedelta(days=1), "end": now}
-        elif time_value == "last_week":
-            return {"start": now - timedelta(weeks=1), "end": now}
-        elif time_value == "last_month":
-            return {"start": now - timedelta(days=30), "end": now}
-        elif time_value == "today":
-            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            return {"start": start_of_day, "end": now}
-        elif time_value == "yesterday":
-            yesterday = now - timedelta(days=1)
-            start_of_yesterday = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_yesterday = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
-            return {"start": start_of_yesterday, "end": end_of_yesterday}
-        elif time_value == "this_week":
-            start_of_week = now - timedelta(days=now.weekday())
-            start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-            return {"start": start_of_week, "end": now}
-        elif time_value == "this_month":
-            start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            return {"start": start_of_month, "end": now}
+        delta = _RELATIVE_TIME_DELTAS.get(time_value)
+        if delta is not None:
+            return {"start": now - delta, "end": now}
+        
+        calendar_range = _CALENDAR_TIME_RANGES.get(time_value)
+        if calendar_range is not None:
+            return calendar_range(now)
         
         # Default to last hour if unknown
-        return {"start": now - timedelta(hours=1), "end": now}
+        return {"start": now - _RELATIVE_TIME_DELTAS["last_hour"], "end": now}
     
-    def _calculate_confidence(self, intent_confidence: float, entities: List[ExtractedEntity]) -> float:
+    def _calculate_confidence(self, intent_confidence: float, entities: Sequence[ExtractedEntity]) -> float:
         """Calculate overall confidence score for the parsed query."""
         if not entities:
             return intent_confidence * 0.7  # Lower confidence without entities
         
-        entity_confidence = sum(e.confidence for e in entities) / len(entities)
+        entity_confidence = sum(map(_entity_confidence, entities)) / len(entities)
         return (intent_confidence + entity_confidence) / 2
     
     def get_query_suggestions(self, partial_query: str) -> List[str]:
         """Get query suggestions based on partial input."""
-        suggestions = [
-            "Show me all failed logins in the last hour",
-            "Generate weekly security summary",
-            "What assets did IP address 192.168.1.100 target?",
-            "Show critical alerts from today",
-            "Find all ERROR logs from container webapp",
-            "Investigate suspicious activity in the last 24 hours",
-            "Generate monthly Docker events report",
-            "Show all unresolved high severity alerts",
-            "What containers had failures yesterday?",
-            "Analyze login trends this week"
-        ]
-        
         if not partial_query:
-            return suggestions[:5]
+            return list(self.suggestions[:5])
         
-        # Simple matching for suggestions
-        partial_lower = partial_query.lower()
-        matching = [s for s in suggestions if any(word in s.lower() for word in partial_lower.split())]
+        # Rank suggestions by how many query words they contain, then by list order
+        hits = Counter()
+        for word in partial_query.lower().split():
+            hits.update(self.suggestion_index.get(word, ()))
         
-        return matching[:5] if matching else suggestions[:3]
+        if not hits:
+            return list(self.suggestions[:3])
+        ranked = sorted(hits, key=lambda i: (-hits[i], i))
+        return [self.suggestions[i] for i in ranked[:5]]
 
 
 # Global parser instance
 _nlp_parser = None
+_nlp_parser_lock = threading.Lock()
 
 def get_nlp_parser() -> NLPQueryParser:
     """Get the global NLP query parser instance."""
     global _nlp_parser
     if _nlp_parser is None:
-        _nlp_parser = NLPQueryParser()
+        with _nlp_parser_lock:
+            if _nlp_parser is None:
+                _nlp_parser = NLPQueryParser()
     return _nlp_parser
 
 def reset_nlp_parser():
     """Reset the global NLP parser instance to pick up updated classifiers."""
     global _nlp_parser
-    _nlp_parser = None
+    with _nlp_parser_lock:
+        _nlp_parser = None
+        _analyze_cached.cache_clear()
+
+@lru_cache(maxsize=1024)
+def _analyze_cached(query: str) -> Tuple[QueryIntent, float, Tuple[ExtractedEntity, ...]]:
+    """Memoize the time-independent part of parsing for repeated queries."""
+    return get_nlp_parser().analyze_query(query)
 
 def parse_natural_query(query: str) -> ParsedQuery:
     """
     Parse a natural language query into structured components.
     
+    Repeated queries reuse the cached classification and entities; relative
+    time ranges are still resolved against the current time on every call.
+    
     Args:
         query: The natural language query string
         
@@ -543,4 +835,4 @@ def parse_natural_query(query: str) -> ParsedQuery:
         ParsedQuery: Structured representation of the query
     """
     parser = get_nlp_parser()
-    return parser.parse_query(query)
\ No newline at end of file
+    return parser._build_parsed_query(query, *_analyze_cached(query))
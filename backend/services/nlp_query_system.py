@@ -5,14 +5,83 @@ This module provides the main interface for processing natural language queries
 about security events, logs, and system monitoring data.
 """
 
+import asyncio
+import copy
+import heapq
 import json
+import threading
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from cachetools import TTLCache
+from sqlalchemy import literal, select
 from sqlalchemy.orm import Session
 
-from services.nlp_query_parser import parse_natural_query, ParsedQuery, QueryIntent
+from services.nlp_query_parser import parse_natural_query, build_suggestion_index, ParsedQuery, QueryIntent
 from services.nlp_query_translator import get_query_translator
 from database import get_sync_db_session
+from performance_config import perf_config
+
+
+# Example queries offered for autocomplete
+_SUGGESTIONS = (
+    "Show me all failed logins in the last hour",
+    "Generate weekly security summary",
+    "What assets did IP address 192.168.1.100 target?",
+    "Show critical alerts from today",
+    "Find all ERROR logs from container webapp",
+    "Investigate suspicious activity in the last 24 hours",
+    "Generate monthly Docker events report",
+    "Show all unresolved high severity alerts",
+    "What containers had failures yesterday?",
+    "Analyze login trends this week",
+    "Show me database connection errors",
+    "Generate security incident report for last month",
+    "What happened with container nginx today?",
+    "Show all authentication failures",
+    "Analyze system performance trends"
+)
+
+
+# Query word -> indices of the suggestions containing it
+_SUGGESTION_INDEX = build_suggestion_index(_SUGGESTIONS)
+
+# Shared, immutable lists embedded in generic and error responses; do not mutate
+_DEFAULT_SUGGESTIONS = _SUGGESTIONS[:8]
+_ERROR_EXAMPLES = _SUGGESTIONS[:3]
+_ERROR_HINTS = (
+    "Try rephrasing your query",
+    "Check if the time range is valid",
+    "Ensure IP addresses are properly formatted",
+    "Use specific container or service names"
+)
+
+
+# Sort rank of alert severities; unknown severities rank lowest
+_SEVERITY_ORDER = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+# Report sections in display order: (report key, title, section type, chart type)
+_REPORT_SECTIONS = (
+    ("alerts_summary", "Security Alerts", "alerts", "pie"),
+    ("docker_events_summary", "Container Activity", "docker_events", "bar"),
+    ("log_analysis", "Log Analysis", "logs", "line"),
+    ("metrics_overview", "System Metrics", "metrics", "gauge"),
+)
+
+# Trend charts in display order: (trends key, chart type, title, y axis)
+_TREND_CHARTS = (
+    ("alert_trends", "line", "Alert Trends", "count"),
+    ("docker_activity_trends", "bar", "Docker Activity", "events"),
+    ("metrics_trends", "area", "System Metrics", "percentage"),
+)
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to ``limit`` characters, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}..."
 
 
 class NLPQuerySystem:
@@ -26,10 +95,25 @@ class NLPQuerySystem:
     - Trend analysis
     """
     
+    SUPPORTED_INTENTS = tuple(intent.value for intent in QueryIntent if intent != QueryIntent.UNKNOWN)
+    
     def __init__(self):
         """Initialize the NLP query system."""
         self.translator = get_query_translator()
-        self.response_cache = {}
+        # Formatted responses keyed by query and user context; opt-in, since
+        # cached results lag behind newly ingested data for up to CACHE_TTL seconds
+        self.cache_enabled = perf_config.ENABLE_RESPONSE_CACHE
+        self.response_cache = TTLCache(maxsize=512, ttl=perf_config.CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        
+        # Intent-specific response formatters; other intents get the generic response
+        self.response_formatters = {
+            QueryIntent.SEARCH_LOGS: self._format_search_response,
+            QueryIntent.SHOW_ALERTS: self._format_alerts_response,
+            QueryIntent.GENERATE_REPORT: self._format_report_response,
+            QueryIntent.INVESTIGATE: self._format_investigation_response,
+            QueryIntent.ANALYZE_TRENDS: self._format_trends_response,
+        }
         
     def process_query(self, query: str, user_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -42,10 +126,33 @@ class NLPQuerySystem:
         Returns:
             Dict containing formatted query results
         """
+        started_ns = time.perf_counter_ns()
+        cache_key = self._get_cache_key(query, user_context) if self.cache_enabled else None
+        if cache_key is not None:
+            with self._cache_lock:
+                cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                response = copy.deepcopy(cached_response)
+                # Restamp every timestamp the formatters took from the original request
+                processed_at = datetime.now().isoformat()
+                response["metadata"]["query_processed_at"] = processed_at
+                if "generated_at" in response:
+                    response["generated_at"] = processed_at
+                response["metadata"]["processing_time_ms"] = self._elapsed_ms(started_ns)
+                return response
+        
         try:
             # Parse the natural language query
             parsed_query = parse_natural_query(query)
             
+            # Queries the parser could not understand get the generic response without a database round trip
+            if (parsed_query.intent == QueryIntent.UNKNOWN
+                    or parsed_query.confidence < perf_config.NLP_MIN_QUERY_CONFIDENCE):
+                processed_at = datetime.now().isoformat()
+                formatted_response = self._format_generic_response({}, parsed_query, processed_at)
+                formatted_response["metadata"] = self._build_metadata(parsed_query, processed_at, started_ns)
+                return formatted_response
+            
             # Get database session
             db_session = get_sync_db_session()
             
@@ -54,16 +161,16 @@ class NLPQuerySystem:
                 raw_results = self.translator.translate_query(parsed_query, db_session)
                 
                 # Format the response based on intent
-                formatted_response = self._format_response(raw_results, parsed_query, user_context)
+                processed_at = datetime.now().isoformat()
+                formatted_response = self._format_response(raw_results, parsed_query, user_context, processed_at)
                 
                 # Add metadata
-                formatted_response["metadata"] = {
-                    "query_processed_at": datetime.now().isoformat(),
-                    "confidence": parsed_query.confidence,
-                    "intent": parsed_query.intent.value,
-                    "entities_found": len(parsed_query.entities),
-                    "processing_time_ms": self._calculate_processing_time()
-                }
+                formatted_response["metadata"] = self._build_metadata(parsed_query, processed_at, started_ns)
+                
+                # Failed lookups are reported in the results; only cache successful ones
+                if cache_key is not None and "error" not in raw_results:
+                    with self._cache_lock:
+                        self.response_cache[cache_key] = copy.deepcopy(formatted_response)
                 
                 return formatted_response
                 
@@ -73,38 +180,45 @@ class NLPQuerySystem:
         except Exception as e:
             return self._format_error_response(str(e), query)
     
+    async def aprocess_query(self, query: str, user_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Process a query from async code without blocking the event loop.
+        
+        The translator runs blocking SQL on a sync session, so the work runs in a
+        worker thread; concurrent queries overlap on their database round trips.
+        
+        Args:
+            query: The natural language query string
+            user_context: Optional user context for personalization
+            
+        Returns:
+            Dict containing formatted query results
+        """
+        return await asyncio.to_thread(self.process_query, query, user_context)
+    
+    def invalidate(self):
+        """Drop all cached query responses, e.g. after data has been modified."""
+        with self._cache_lock:
+            self.response_cache.clear()
+    
+    def _get_cache_key(self, query: str, user_context: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """Build the response cache key for a query and its user context."""
+        context_key = json.dumps(user_context, sort_keys=True, default=str) if user_context else ""
+        return query, context_key
+    
     def get_query_suggestions(self, partial_query: str = "") -> List[str]:
         """Get query suggestions for autocomplete."""
-        suggestions = [
-            "Show me all failed logins in the last hour",
-            "Generate weekly security summary",
-            "What assets did IP address 192.168.1.100 target?",
-            "Show critical alerts from today",
-            "Find all ERROR logs from container webapp",
-            "Investigate suspicious activity in the last 24 hours",
-            "Generate monthly Docker events report",
-            "Show all unresolved high severity alerts",
-            "What containers had failures yesterday?",
-            "Analyze login trends this week",
-            "Show me database connection errors",
-            "Generate security incident report for last month",
-            "What happened with container nginx today?",
-            "Show all authentication failures",
-            "Analyze system performance trends"
-        ]
-        
         if not partial_query:
-            return suggestions[:8]
+            return list(_DEFAULT_SUGGESTIONS)
         
         # Filter suggestions based on partial query
-        partial_lower = partial_query.lower()
-        matching = []
-        
-        for suggestion in suggestions:
-            if any(word in suggestion.lower() for word in partial_lower.split()):
-                matching.append(suggestion)
+        hits = set()
+        for word in partial_query.lower().split():
+            hits.update(_SUGGESTION_INDEX.get(word, ()))
         
-        return matching[:8] if matching else suggestions[:5]
+        if not hits:
+            return list(_SUGGESTIONS[:5])
+        return [_SUGGESTIONS[i] for i in sorted(hits)[:8]]
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get the status of the NLP query system."""
@@ -112,9 +226,8 @@ class NLPQuerySystem:
             db_session = get_sync_db_session()
             
             try:
-                # Test database connectivity
-                from db_models import AlertsModel
-                recent_alerts = db_session.query(AlertsModel).limit(1).all()
+                # Test database connectivity with a round trip that reads no table data
+                db_session.execute(select(literal(1))).scalar()
                 db_status = "connected"
             except Exception as e:
                 db_status = f"error: {str(e)}"
@@ -124,7 +237,7 @@ class NLPQuerySystem:
             return {
                 "status": "operational",
                 "database": db_status,
-                "supported_intents": [intent.value for intent in QueryIntent if intent != QueryIntent.UNKNOWN],
+                "supported_intents": list(self.SUPPORTED_INTENTS),
                 "features": {
                     "query_processing": True,
                     "report_generation": True,
@@ -148,24 +261,19 @@ class NLPQuerySystem:
                 }
             }
     
-    def _format_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery, user_context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        """Format the response based on query intent and results."""
-        intent = parsed_query.intent
-        
-        if intent == QueryIntent.SEARCH_LOGS:
-            return self._format_search_response(raw_results, parsed_query)
-        elif intent == QueryIntent.SHOW_ALERTS:
-            return self._format_alerts_response(raw_results, parsed_query)
-        elif intent == QueryIntent.GENERATE_REPORT:
-            return self._format_report_response(raw_results, parsed_query)
-        elif intent == QueryIntent.INVESTIGATE:
-            return self._format_investigation_response(raw_results, parsed_query)
-        elif intent == QueryIntent.ANALYZE_TRENDS:
-            return self._format_trends_response(raw_results, parsed_query)
-        else:
-            return self._format_generic_response(raw_results, parsed_query)
+    def _format_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery, user_context: Optional[Dict[str, Any]],
+                         processed_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Format the response based on query intent and results.
+        
+        ``processed_at`` is the request's ISO timestamp, shared by every timestamp in
+        the response; it defaults to the current time.
+        """
+        formatter = self.response_formatters.get(parsed_query.intent, self._format_generic_response)
+        return formatter(raw_results, parsed_query, processed_at)
     
-    def _format_search_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_search_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format search results for log queries."""
         results = raw_results.get("results", [])
         count = raw_results.get("count", 0)
@@ -193,7 +301,8 @@ class NLPQuerySystem:
             ]
         }
     
-    def _format_alerts_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_alerts_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format alerts display response."""
         results = raw_results.get("results", [])
         count = raw_results.get("count", 0)
@@ -223,7 +332,8 @@ class NLPQuerySystem:
             ]
         }
     
-    def _format_report_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_report_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format report generation response."""
         report = raw_results.get("report", {})
         
@@ -236,7 +346,7 @@ class NLPQuerySystem:
         return {
             "type": "security_report",
             "title": "Security Analysis Report",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": processed_at or datetime.now().isoformat(),
             "time_period": report.get("time_period", {}),
             "executive_summary": executive_summary,
             "sections": formatted_sections,
@@ -249,22 +359,23 @@ class NLPQuerySystem:
             ]
         }
     
-    def _format_investigation_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_investigation_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                       processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format investigation response."""
         investigation = raw_results.get("investigation", {})
         
         # Create investigation summary
         summary = self._create_investigation_summary(investigation, parsed_query)
         
-        # Format investigation findings
-        findings = self._format_investigation_findings(investigation)
+        # Format findings, overall risk and timeline in one pass over the investigation
+        findings, risk_assessment, timeline = self._analyze_investigation(investigation)
         
         return {
             "type": "investigation_results",
             "summary": summary,
             "findings": findings,
-            "risk_assessment": self._assess_investigation_risk(investigation),
-            "timeline": self._create_investigation_timeline(investigation),
+            "risk_assessment": risk_assessment,
+            "timeline": timeline,
             "query_info": raw_results.get("query_info", {}),
             "actions": [
                 {"label": "Create Incident", "action": "create_incident"},
@@ -273,7 +384,8 @@ class NLPQuerySystem:
             ]
         }
     
-    def _format_trends_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_trends_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format trends analysis response."""
         trends = raw_results.get("trends", {})
         
@@ -297,12 +409,13 @@ class NLPQuerySystem:
             ]
         }
     
-    def _format_generic_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery) -> Dict[str, Any]:
+    def _format_generic_response(self, raw_results: Dict[str, Any], parsed_query: ParsedQuery,
+                                 processed_at: Optional[str] = None) -> Dict[str, Any]:
         """Format generic response for unknown intents."""
         return {
             "type": "generic_response",
             "message": "I understand you're looking for information, but I need more specific details.",
-            "suggestions": self.get_query_suggestions(),
+            "suggestions": _DEFAULT_SUGGESTIONS,
             "raw_results": raw_results,
             "query_info": {
                 "original_query": parsed_query.original_query,
@@ -313,40 +426,34 @@ class NLPQuerySystem:
     
     def _categorize_log_results(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
         """Categorize log results by type."""
-        categories = {"errors": 0, "warnings": 0, "info": 0, "other": 0}
+        errors = warnings = info = other = 0
         
         for result in results:
             message = result.get("message", "").lower()
             if "error" in message or "fail" in message:
-                categories["errors"] += 1
-            elif "warn" in message or "warning" in message:
-                categories["warnings"] += 1
+                errors += 1
+            elif "warn" in message:  # also covers "warning"
+                warnings += 1
             elif "info" in message:
-                categories["info"] += 1
+                info += 1
             else:
-                categories["other"] += 1
+                other += 1
         
-        return categories
+        return {"errors": errors, "warnings": warnings, "info": info, "other": other}
     
     def _prioritize_alerts(self, alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize alerts by severity and timestamp."""
-        severity_order = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+        severity_rank = _SEVERITY_ORDER.get
         
         return sorted(alerts, key=lambda x: (
-            severity_order.get(x.get("severity", "LOW"), 0),
+            severity_rank(x.get("severity", "LOW"), 0),
             x.get("timestamp", "")
         ), reverse=True)
     
     def _get_priority_breakdown(self, alerts: List[Dict[str, Any]]) -> Dict[str, int]:
         """Get breakdown of alerts by priority."""
-        breakdown = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-        
-        for alert in alerts:
-            severity = alert.get("severity", "LOW")
-            if severity in breakdown:
-                breakdown[severity] += 1
-        
-        return breakdown
+        severity_counts = Counter(alert.get("severity", "LOW") for alert in alerts)
+        return {severity: severity_counts[severity] for severity in ("HIGH", "MEDIUM", "LOW")}
     
     def _create_executive_summary(self, report: Dict[str, Any]) -> str:
         """Create executive summary for reports."""
@@ -371,45 +478,11 @@ class NLPQuerySystem:
     
     def _format_report_sections(self, report: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format report sections for display."""
-        sections = []
-        
-        # Alerts section
-        if "alerts_summary" in report:
-            sections.append({
-                "title": "Security Alerts",
-                "type": "alerts",
-                "data": report["alerts_summary"],
-                "chart_type": "pie"
-            })
-        
-        # Docker events section
-        if "docker_events_summary" in report:
-            sections.append({
-                "title": "Container Activity",
-                "type": "docker_events",
-                "data": report["docker_events_summary"],
-                "chart_type": "bar"
-            })
-        
-        # Log analysis section
-        if "log_analysis" in report:
-            sections.append({
-                "title": "Log Analysis",
-                "type": "logs",
-                "data": report["log_analysis"],
-                "chart_type": "line"
-            })
-        
-        # Metrics section
-        if "metrics_overview" in report:
-            sections.append({
-                "title": "System Metrics",
-                "type": "metrics",
-                "data": report["metrics_overview"],
-                "chart_type": "gauge"
-            })
-        
-        return sections
+        return [
+            {"title": title, "type": section_type, "data": report[key], "chart_type": chart_type}
+            for key, title, section_type, chart_type in _REPORT_SECTIONS
+            if key in report
+        ]
     
     def _create_investigation_summary(self, investigation: Dict[str, Any], parsed_query: ParsedQuery) -> str:
         """Create investigation summary."""
@@ -437,69 +510,61 @@ class NLPQuerySystem:
         
         return summary
     
-    def _format_investigation_findings(self, investigation: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Format investigation findings."""
+    def _analyze_investigation(self, investigation: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str, List[Dict[str, Any]]]:
+        """Build the findings, overall risk level and event timeline of an investigation."""
         findings = []
+        risk_levels = set()
+        events = []
         
         for key, data in investigation.items():
-            if isinstance(data, dict):
-                finding = {
-                    "type": key,
-                    "title": key.replace("_", " ").title(),
-                    "data": data,
-                    "severity": self._assess_finding_severity(data)
-                }
-                findings.append(finding)
-        
-        return findings
-    
-    def _assess_investigation_risk(self, investigation: Dict[str, Any]) -> str:
-        """Assess overall risk level from investigation."""
-        risk_levels = []
-        
-        for data in investigation.values():
-            if isinstance(data, dict):
-                if "risk_assessment" in data:
-                    risk_levels.append(data["risk_assessment"])
-                elif "health_status" in data and data["health_status"] == "UNHEALTHY":
-                    risk_levels.append("HIGH")
+            if not isinstance(data, dict):
+                continue
+            
+            findings.append({
+                "type": key,
+                "title": key.replace("_", " ").title(),
+                "data": data,
+                "severity": self._assess_finding_severity(data)
+            })
+            
+            if "risk_assessment" in data:
+                risk_levels.add(data["risk_assessment"])
+            elif "health_status" in data and data["health_status"] == "UNHEALTHY":
+                risk_levels.add("HIGH")
+            
+            events.extend(self._iter_finding_events(data))
         
         if "HIGH" in risk_levels:
-            return "HIGH"
+            risk_assessment = "HIGH"
         elif "MEDIUM" in risk_levels:
-            return "MEDIUM"
+            risk_assessment = "MEDIUM"
         else:
-            return "LOW"
-    
-    def _create_investigation_timeline(self, investigation: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Create timeline from investigation data."""
-        timeline = []
-        
-        # Extract events from investigation data
-        for data in investigation.values():
-            if isinstance(data, dict):
-                if "related_logs" in data:
-                    for log in data["related_logs"][:5]:  # Limit to 5 most recent
-                        timeline.append({
-                            "timestamp": log.get("timestamp"),
-                            "type": "log",
-                            "description": log.get("message", "")[:100] + "...",
-                            "severity": "info"
-                        })
-                
-                if "related_alerts" in data:
-                    for alert in data["related_alerts"][:5]:
-                        timeline.append({
-                            "timestamp": alert.get("timestamp"),
-                            "type": "alert",
-                            "description": alert.get("message", "")[:100] + "...",
-                            "severity": alert.get("severity", "LOW").lower()
-                        })
+            risk_assessment = "LOW"
         
-        # Sort by timestamp
-        timeline.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        # Keep the 10 most recent events without sorting every candidate
+        timeline = heapq.nlargest(10, events, key=lambda x: x.get("timestamp", ""))
         
-        return timeline[:10]  # Return top 10 events
+        return findings, risk_assessment, timeline
+    
+    def _iter_finding_events(self, data: Dict[str, Any]):
+        """Yield timeline events from one investigation finding."""
+        if "related_logs" in data:
+            for log in data["related_logs"][:5]:  # Limit to 5 most recent
+                yield {
+                    "timestamp": log.get("timestamp"),
+                    "type": "log",
+                    "description": _truncate(log.get("message", "")),
+                    "severity": "info"
+                }
+        
+        if "related_alerts" in data:
+            for alert in data["related_alerts"][:5]:
+                yield {
+                    "timestamp": alert.get("timestamp"),
+                    "type": "alert",
+                    "description": _truncate(alert.get("message", "")),
+                    "severity": alert.get("severity", "LOW").lower()
+                }
     
     def _create_trends_summary(self, trends: Dict[str, Any]) -> str:
         """Create trends summary."""
@@ -528,39 +593,11 @@ class NLPQuerySystem:
     
     def _format_trends_for_charts(self, trends: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format trend data for chart visualization."""
-        charts = []
-        
-        # Alert trends chart
-        if "alert_trends" in trends:
-            charts.append({
-                "type": "line",
-                "title": "Alert Trends",
-                "data": trends["alert_trends"],
-                "x_axis": "time",
-                "y_axis": "count"
-            })
-        
-        # Docker activity chart
-        if "docker_activity_trends" in trends:
-            charts.append({
-                "type": "bar",
-                "title": "Docker Activity",
-                "data": trends["docker_activity_trends"],
-                "x_axis": "time",
-                "y_axis": "events"
-            })
-        
-        # Metrics trends chart
-        if "metrics_trends" in trends:
-            charts.append({
-                "type": "area",
-                "title": "System Metrics",
-                "data": trends["metrics_trends"],
-                "x_axis": "time",
-                "y_axis": "percentage"
-            })
-        
-        return charts
+        return [
+            {"type": chart_type, "title": title, "data": trends[key], "x_axis": "time", "y_axis": y_axis}
+            for key, chart_type, title, y_axis in _TREND_CHARTS
+            if key in trends
+        ]
     
     def _generate_trend_insights(self, trends: Dict[str, Any]) -> List[str]:
         """Generate insights from trend data."""
@@ -612,10 +649,19 @@ class NLPQuerySystem:
         else:
             return "LOW"
     
-    def _calculate_processing_time(self) -> float:
-        """Calculate processing time (mock implementation)."""
-        import random
-        return round(random.uniform(50, 200), 2)
+    def _build_metadata(self, parsed_query: ParsedQuery, processed_at: str, started_ns: int) -> Dict[str, Any]:
+        """Build the metadata block attached to query responses."""
+        return {
+            "query_processed_at": processed_at,
+            "confidence": parsed_query.confidence,
+            "intent": parsed_query.intent.value,
+            "entities_found": len(parsed_query.entities),
+            "processing_time_ms": self._elapsed_ms(started_ns)
+        }
+    
+    def _elapsed_ms(self, started_ns: int) -> float:
+        """Milliseconds elapsed since a ``time.perf_counter_ns()`` reading."""
+        return round((time.perf_counter_ns() - started_ns) / 1e6, 2)
     
     def _format_error_response(self, error: str, query: str) -> Dict[str, Any]:
         """Format error response."""
@@ -623,24 +669,22 @@ class NLPQuerySystem:
             "type": "error",
             "error": error,
             "original_query": query,
-            "suggestions": [
-                "Try rephrasing your query",
-                "Check if the time range is valid",
-                "Ensure IP addresses are properly formatted",
-                "Use specific container or service names"
-            ],
-            "examples": self.get_query_suggestions()[:3]
+            "suggestions": _ERROR_HINTS,
+            "examples": _ERROR_EXAMPLES
         }
 
 
 # Global system instance
 _nlp_system = None
+_nlp_system_lock = threading.Lock()
 
 def get_nlp_system() -> NLPQuerySystem:
     """Get the global NLP query system instance."""
     global _nlp_system
     if _nlp_system is None:
-        _nlp_system = NLPQuerySystem()
+        with _nlp_system_lock:
+            if _nlp_system is None:
+                _nlp_system = NLPQuerySystem()
     return _nlp_system
 
 def process_natural_query(query: str, user_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -655,4 +699,18 @@ def process_natural_query(query: str, user_context: Optional[Dict[str, Any]] = N
         Dict containing formatted query results
     """
     system = get_nlp_system()
-    return system.process_query(query, user_context)
\ No newline at end of file
+    return system.process_query(query, user_context)
+
+async def aprocess_natural_query(query: str, user_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Process a natural language query from async code without blocking the event loop.
+    
+    Args:
+        query: The natural language query string
+        user_context: Optional user context for personalization
+        
+    Returns:
+        Dict containing formatted query results
+    """
+    system = get_nlp_system()
+    return await system.aprocess_query(query, user_context)
\ No newline at end of file
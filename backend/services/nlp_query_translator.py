@@ -5,10 +5,19 @@ This module translates structured NLP queries into SQL queries and other data so
 queries for security monitoring and log analysis.
 """
 
+import base64
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, Union
-from sqlalchemy import and_, or_, desc, func, text
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Union
+from sqlalchemy import DateTime, and_, desc, func, lambda_stmt, select, text, tuple_
 from sqlalchemy.orm import Session
+from cachetools import TTLCache
 
 from db_models import (
     ContainerLogsModel, DockerEventsModel, AlertsModel, 
@@ -17,6 +26,316 @@ from db_models import (
 from services.nlp_query_parser import ParsedQuery, QueryIntent, EntityType
 from services.summary_service import summary_service
 from services.anomaly_detection import anomaly_detector
+from performance_config import perf_config
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional; search routing falls back to regex alternations
+    ahocorasick = None
+
+
+def _encode_cursor(ts: datetime, row_id: int) -> str:
+    """Encode the (timestamp, id) of the last row on a page as an opaque cursor."""
+    payload = json.dumps([ts.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor; raises ValueError if malformed."""
+    try:
+        ts, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(ts), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+# Fixed windows used by the fetch helpers and handler defaults
+_ONE_HOUR = timedelta(hours=1)
+_ONE_WEEK = timedelta(weeks=1)
+_THIRTY_DAYS = timedelta(days=30)
+
+# Distinct containers logging within [:start, :end], counted with a loose index scan:
+# each step jumps to the next container name on idx_container_logs_container_timestamp
+# instead of sorting every row in the range. A NULL container counts once, like DISTINCT.
+_DISTINCT_LOG_CONTAINERS_SQL = text("""
+    WITH RECURSIVE containers(container) AS (
+        SELECT (
+            SELECT container FROM container_logs
+            WHERE container IS NOT NULL AND timestamp >= :start AND timestamp <= :end
+            ORDER BY container LIMIT 1
+        )
+        UNION ALL
+        SELECT (
+            SELECT l.container FROM container_logs l
+            WHERE l.container > containers.container AND l.timestamp >= :start AND l.timestamp <= :end
+            ORDER BY l.container LIMIT 1
+        )
+        FROM containers
+        WHERE containers.container IS NOT NULL
+    )
+    SELECT count(container) + CASE WHEN EXISTS (
+        SELECT 1 FROM container_logs
+        WHERE container IS NULL AND timestamp >= :start AND timestamp <= :end
+    ) THEN 1 ELSE 0 END
+    FROM containers
+""")
+
+# Column names per queryable model, so filter construction skips per-call hasattr checks
+_MODEL_COLUMNS = MappingProxyType({
+    model: frozenset(column.name for column in model.__table__.columns)
+    for model in (ContainerLogsModel, DockerEventsModel, AlertsModel, MetricsModel, EmailNotificationsModel)
+})
+
+# Analytics period for the first keyword found in a query, in precedence order
+_TIME_PERIOD_KEYWORDS = (("week", "7d"), ("month", "30d"), ("hour", "1h"))
+
+# Ranges ending this close to now may still receive rows, so their sections aren't cached
+_SECTION_CACHE_SETTLE_TIME = timedelta(minutes=1)
+
+# Shared pool for running independent report/trend sections concurrently
+_REPORT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="report-section")
+
+# Constant metadata blocks for the fetch helpers' responses; shared, so treat as read-only
+_FETCH_METADATA = {
+    query_type: {"query_type": query_type, "processing_time_ms": 0, "confidence": 1.0}
+    for query_type in (
+        "fetch_all_logs", "fetch_logs_by_message_pattern", "fetch_logs_by_container",
+        "fetch_latest_logs", "fetch_logs_last_hour"
+    )
+}
+
+# Pages larger than this are streamed from a server-side cursor in batches of this size
+_STREAM_BATCH_SIZE = 200
+
+
+# Phrase sets used to route log searches to the simple fetch helpers
+_LATEST_LOG_PATTERNS = frozenset({
+    "latest logs", "recent logs", "newest logs", "most recent logs",
+    "show latest logs", "get latest logs", "display latest logs",
+    "show recent logs", "get recent logs", "display recent logs",
+    "latest 50", "recent 50", "last 50"
+})
+
+_LAST_HOUR_PATTERNS = frozenset({
+    "last hour", "past hour", "previous hour", "logs from last hour",
+    "logs from past hour", "logs from previous hour", "hour ago",
+    "logs in the last hour", "logs in the past hour"
+})
+
+_CONTAINER_PATTERNS = frozenset({
+    "container logs", "logs from container", "logs for container",
+    "show container", "get container", "display container",
+    "container logs for", "container"
+})
+
+_SHOW_ALL_PATTERNS = frozenset({
+    "show all logs", "display all logs", "get all logs", "list all logs",
+    "show every log", "display every log", "get every log", "list every log",
+    "show me all logs", "show me every log", "all logs", "every log"
+})
+
+# Terms that make a query specific enough to skip the "recent logs" fallback
+_SPECIFIC_SEARCH_TERMS = (
+    "error", "warning", "alert",
+    "nginx", "postgres", "redis", "app", "web", "db", "api"
+)
+
+# Route categories checked by _classify_search_intent, in precedence order
+_SEARCH_ROUTE_PATTERNS = (
+    ("latest", _LATEST_LOG_PATTERNS),
+    ("last_hour", _LAST_HOUR_PATTERNS),
+    ("container", _CONTAINER_PATTERNS),
+    ("show_all", _SHOW_ALL_PATTERNS),
+    ("specific", _SPECIFIC_SEARCH_TERMS),
+)
+
+
+def _build_route_automaton():
+    """
+    Build one Aho-Corasick automaton over every routing phrase.
+    
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    categories_by_phrase: Dict[str, set] = {}
+    for category, patterns in _SEARCH_ROUTE_PATTERNS:
+        for pattern in patterns:
+            categories_by_phrase.setdefault(pattern, set()).add(category)
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, categories in categories_by_phrase.items():
+        automaton.add_word(phrase, frozenset(categories))
+    automaton.make_automaton()
+    return automaton
+
+
+_ROUTE_AUTOMATON = _build_route_automaton()
+
+# Fallback when pyahocorasick is missing: one C-level alternation per category
+_ROUTE_REGEXES = tuple(
+    (category, re.compile("|".join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))))
+    for category, patterns in _SEARCH_ROUTE_PATTERNS
+)
+
+
+def _match_route_categories(query: str) -> set:
+    """Return the route categories with at least one phrase occurring in query."""
+    if _ROUTE_AUTOMATON is not None:
+        return {category for _, categories in _ROUTE_AUTOMATON.iter(query) for category in categories}
+    return {category for category, regex in _ROUTE_REGEXES if regex.search(query)}
+
+
+_CONTAINER_NAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "container webapp"
+    r'from\s+container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "from container webapp"
+    r'for\s+container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "for container webapp"
+    r'([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])\s+container',  # "webapp container"
+    r'logs\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "logs webapp"
+    r'show\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "show webapp"
+))
+
+# Words the container name patterns pick up that aren't container names
+_NON_CONTAINER_WORDS = frozenset({
+    'logs', 'all', 'recent', 'latest', 'show', 'get', 'display', 'from', 'for', 'the', 'a', 'an'
+})
+
+
+def _extract_container_name(query: str) -> Optional[str]:
+    """Return the first container name mentioned in query, if any."""
+    for pattern in _CONTAINER_NAME_PATTERNS:
+        match = pattern.search(query)
+        if match:
+            container_name = match.group(1)
+            if container_name.lower() not in _NON_CONTAINER_WORDS:
+                return container_name
+    return None
+
+
+def _time_range_filter(model, time_range: Dict[str, datetime]):
+    """Return the inclusive [start, end] predicate on model.timestamp."""
+    return and_(model.timestamp >= time_range["start"], model.timestamp <= time_range["end"])
+
+
+def _first_entities_by_type(entities) -> Dict[EntityType, Any]:
+    """Map each entity type to the first entity of that type."""
+    entities_by_type = {}
+    for entity in entities:
+        entities_by_type.setdefault(entity.type, entity)
+    return entities_by_type
+
+
+# Words _extract_search_terms drops before building the message text filter
+_SEARCH_STOP_WORDS = frozenset({
+    "show", "me", "all", "the", "in", "from", "with", "and", "or", "of",
+    "to", "for", "on", "at", "by", "is", "are", "was", "were", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "can", "must", "shall", "a", "an", "this",
+    "that", "these", "those"
+})
+
+# Time-related words, already handled by the time range filter
+_SEARCH_TIME_WORDS = frozenset({"hour", "day", "week", "month", "today", "yesterday", "last", "past"})
+
+# Generic terms that indicate "show all" rather than specific search
+_GENERIC_LOG_TERMS = frozenset({
+    "logs", "log", "entries", "entry", "events", "event", "data", "records",
+    "record", "messages", "message", "items", "item", "everything", "every",
+    "container", "containers", "docker", "system"
+})
+
+
+@lru_cache(maxsize=16)
+def _values_serializer(model_cls):
+    """
+    Build a function turning model_cls column values, in table order, into a dict.
+    
+    Column names and DateTime columns are resolved once per model, so
+    serializing a row is one zip plus isoformat on its timestamps.
+    """
+    columns = model_cls.__table__.columns
+    column_names = tuple(column.name for column in columns)
+    datetime_names = tuple(column.name for column in columns if isinstance(column.type, DateTime))
+    
+    def serialize(values) -> Dict[str, Any]:
+        data = dict(zip(column_names, values))
+        for name in datetime_names:
+            value = data[name]
+            if value is not None:
+                data[name] = value.isoformat()
+        return data
+    
+    return serialize
+
+
+@lru_cache(maxsize=16)
+def _model_serializer(model_cls):
+    """Build a function turning a model_cls instance into a dict of its columns."""
+    serialize_values = _values_serializer(model_cls)
+    get_values = attrgetter(*(column.name for column in model_cls.__table__.columns))
+    if len(model_cls.__table__.columns) == 1:
+        return lambda row: serialize_values((get_values(row),))
+    return lambda row: serialize_values(get_values(row))
+
+
+@lru_cache(maxsize=4096)
+def _extract_search_terms_cached(query: str) -> Tuple[str, ...]:
+    """Return up to 5 search terms from query, minus stop and time words."""
+    search_terms = [
+        word for word in query.lower().split()
+        if word not in _SEARCH_STOP_WORDS and len(word) > 2 and word not in _SEARCH_TIME_WORDS
+    ]
+    return tuple(search_terms[:5])
+
+
+def _like_term_to_regex(term: str) -> str:
+    """Translate the body of an ILIKE '%term%' pattern into an equivalent regex."""
+    parts = []
+    chars = iter(term)
+    for char in chars:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        elif char == "\\":
+            parts.append(re.escape(next(chars, "\\")))
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _search_terms_regex(terms: Tuple[str, ...]) -> str:
+    """Build one case-insensitive alternation matching any of terms as a substring."""
+    return "|".join(_like_term_to_regex(term) for term in terms)
+
+
+@lru_cache(maxsize=512)
+def _classify_search_intent(original_query: str) -> Tuple[str, Optional[str]]:
+    """
+    Route a lowercased log search query to one of the simple fetch paths.
+    
+    Returns:
+        Tuple of (route, container_name) where route is one of "latest",
+        "last_hour", "container", "show_all", "recent" or "complex";
+        container_name is only set for the "container" route
+    """
+    categories = _match_route_categories(original_query)
+    if "latest" in categories:
+        return "latest", None
+    if "last_hour" in categories:
+        return "last_hour", None
+    if "container" in categories:
+        container_name = _extract_container_name(original_query)
+        if container_name:
+            return "container", container_name
+    if "show_all" in categories:
+        return "show_all", None
+    if "specific" not in categories:
+        return "recent", None
+    return "complex", None
 
 
 class QueryTranslator:
@@ -38,57 +357,125 @@ class QueryTranslator:
             "notifications": EmailNotificationsModel
         }
         
-        # Map query intents to handler methods
-        self.intent_handlers = {
-            QueryIntent.SEARCH_LOGS: self._handle_search_logs,
-            QueryIntent.SHOW_ALERTS: self._handle_show_alerts,
-            QueryIntent.GENERATE_REPORT: self._handle_generate_report,
-            QueryIntent.INVESTIGATE: self._handle_investigate,
-            QueryIntent.ANALYZE_TRENDS: self._handle_analyze_trends,
-            QueryIntent.ANALYTICS_SUMMARY: self._handle_analytics_summary,
-            QueryIntent.ANALYTICS_ANOMALIES: self._handle_analytics_anomalies,
-            QueryIntent.ANALYTICS_PERFORMANCE: self._handle_analytics_performance,
-            QueryIntent.ANALYTICS_METRICS: self._handle_analytics_metrics
-        }
+        # Short-lived cache for opt-in total counts so repeat dashboard loads don't re-scan
+        self.count_cache = TTLCache(maxsize=256, ttl=perf_config.LOG_COUNT_CACHE_TTL)
+        self._count_lock = threading.Lock()
+        
+        # Report/trend sections over ranges that have already closed, keyed by section and bounds
+        self.section_cache = TTLCache(maxsize=512, ttl=perf_config.SECTION_CACHE_TTL)
+        self._section_lock = threading.Lock()
+    
+    def _fetch_log_page(self, db_session: Session, stmt, limit: int, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch one page of logs newest-first using keyset pagination.
+        
+        Rows are ordered by (timestamp, id) descending and the cursor marks the
+        last row already returned, so each page is an index range scan instead
+        of skipping OFFSET rows.
+        
+        One extra row is fetched to tell whether another page exists without
+        counting the whole result set. stmt is a lambda_stmt, so the cursor,
+        ordering and limit are appended as cached lambdas and repeat calls
+        reuse the compiled SQL with fresh bound values.
+        
+        stmt selects the container_logs table columns rather than the ORM
+        entity, so rows come back as mappings without identity-map bookkeeping
+        and only the timestamp needs converting for JSON. Large pages are
+        streamed in batches and serialized as they arrive, so the raw rows are
+        never all held in memory at once.
+        
+        Returns:
+            Tuple of (serialized logs, next_cursor); next_cursor is None on the last page
+        """
+        if limit <= 0:
+            # An empty page has no last row to continue from
+            return [], None
+        if cursor:
+            ts, row_id = _decode_cursor(cursor)
+            stmt += lambda s: s.where(
+                tuple_(ContainerLogsModel.timestamp, ContainerLogsModel.id) < tuple_(ts, row_id)
+            )
+        page_size = limit + 1
+        stmt += lambda s: s.order_by(desc(ContainerLogsModel.timestamp), desc(ContainerLogsModel.id))\
+            .limit(page_size)
+        if page_size > _STREAM_BATCH_SIZE:
+            result = db_session.execute(stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE})
+        else:
+            result = db_session.execute(stmt)
+        
+        logs = []
+        last_row = None
+        next_cursor = None
+        try:
+            for row in result.mappings():
+                if len(logs) == limit:
+                    # The extra row only signals that another page exists
+                    next_cursor = _encode_cursor(last_row["timestamp"], last_row["id"])
+                    break
+                logs.append({**row, "timestamp": row["timestamp"].isoformat()})
+                last_row = row
+        finally:
+            result.close()
+        return logs, next_cursor
+    
+    def _container_stmt(self, container: str):
+        """
+        Build the cached log select for fetch_logs_by_container.
+        
+        A single trailing wildcard ("web-*" or "web-%") is a prefix match on
+        lower(container), served by the text_pattern_ops index. Anything else
+        is a case-insensitive substring match served by the trigram index.
+        """
+        prefix = container[:-1]
+        if container.endswith(("*", "%")) and prefix and not any(c in prefix for c in "*%"):
+            like = prefix.lower().replace("\\", "\\\\").replace("_", "\\_") + "%"
+            return lambda_stmt(lambda: select(ContainerLogsModel.__table__).where(
+                func.lower(ContainerLogsModel.container).like(like, escape="\\")
+            ))
+        like = f"%{container.replace('*', '%')}%"
+        return lambda_stmt(lambda: select(ContainerLogsModel.__table__).where(ContainerLogsModel.container.ilike(like)))
+    
+    def _count_logs(self, db_session: Session, stmt, cache_key: Tuple[Any, ...]) -> int:
+        """Count the rows matched by stmt, reusing a recent count for the same filter."""
+        with self._count_lock:
+            total_count = self.count_cache.get(cache_key)
+        if total_count is None:
+            stmt += lambda s: s.with_only_columns(func.count(), maintain_column_froms=True)
+            total_count = db_session.execute(stmt).scalar_one()
+            with self._count_lock:
+                self.count_cache[cache_key] = total_count
+        return total_count
     
-    def fetch_all_logs(self, db_session: Session, limit: int = 1000, offset: int = 0) -> Dict[str, Any]:
+    def fetch_all_logs(self, db_session: Session, limit: int = 1000, cursor: Optional[str] = None, include_total: bool = False) -> Dict[str, Any]:
         """
         Simple function to fetch all logs without any filtering.
         
         Args:
             db_session: Database session
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Also return total_count for the whole result set
             
         Returns:
             Dictionary with logs data and metadata
         """
         try:
-            # Get total count
-            total_count = db_session.query(ContainerLogsModel).count()
-            
-            # Fetch logs with limit and offset
-            logs = db_session.query(ContainerLogsModel)\
-                .order_by(desc(ContainerLogsModel.timestamp))\
-                .limit(limit)\
-                .offset(offset)\
-                .all()
+            # Fetch the page after the cursor
+            stmt = lambda_stmt(lambda: select(ContainerLogsModel.__table__))
+            logs, next_cursor = self._fetch_log_page(db_session, stmt, limit, cursor)
+            total_count = self._count_logs(db_session, stmt, ("all",)) if include_total else None
             
             return {
                 "success": True,
                 "data": {
-                    "logs": [self._serialize_result(log) for log in logs],
+                    "logs": logs,
                     "count": len(logs),
                     "total_count": total_count,
                     "limit": limit,
-                    "offset": offset,
-                    "has_more": offset + len(logs) < total_count
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None
                 },
-                "metadata": {
-                    "query_type": "fetch_all_logs",
-                    "processing_time_ms": 0,
-                    "confidence": 1.0
-                }
+                "metadata": _FETCH_METADATA["fetch_all_logs"]
             }
         except Exception as e:
             return {
@@ -97,7 +484,7 @@ class QueryTranslator:
                 "data": {"logs": [], "count": 0}
             }
     
-    def fetch_logs_by_message_pattern(self, db_session: Session, pattern: str, limit: int = 1000, offset: int = 0) -> Dict[str, Any]:
+    def fetch_logs_by_message_pattern(self, db_session: Session, pattern: str, limit: int = 1000, cursor: Optional[str] = None, include_total: bool = False) -> Dict[str, Any]:
         """
         Simple function to fetch logs by message pattern.
         
@@ -105,41 +492,33 @@ class QueryTranslator:
             db_session: Database session
             pattern: Pattern to search for in log messages
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Also return total_count for the whole result set
             
         Returns:
             Dictionary with logs data and metadata
         """
         try:
-            # Get total count for this pattern
-            total_count = db_session.query(ContainerLogsModel)\
-                .filter(ContainerLogsModel.message.ilike(f"%{pattern}%"))\
-                .count()
-            
-            # Fetch logs with pattern filter
-            logs = db_session.query(ContainerLogsModel)\
-                .filter(ContainerLogsModel.message.ilike(f"%{pattern}%"))\
-                .order_by(desc(ContainerLogsModel.timestamp))\
-                .limit(limit)\
-                .offset(offset)\
-                .all()
+            # Fetch the page after the cursor. Plain ILIKE (not lower()) so the
+            # message trigram index applies; patterns under 3 chars have no trigrams
+            # and the planner walks the timestamp index until the page fills.
+            like = f"%{pattern}%"
+            stmt = lambda_stmt(lambda: select(ContainerLogsModel.__table__).where(ContainerLogsModel.message.ilike(like)))
+            logs, next_cursor = self._fetch_log_page(db_session, stmt, limit, cursor)
+            total_count = self._count_logs(db_session, stmt, ("pattern", pattern)) if include_total else None
             
             return {
                 "success": True,
                 "data": {
-                    "logs": [self._serialize_result(log) for log in logs],
+                    "logs": logs,
                     "count": len(logs),
                     "total_count": total_count,
                     "limit": limit,
-                    "offset": offset,
+                    "next_cursor": next_cursor,
                     "pattern_filter": pattern,
-                    "has_more": offset + len(logs) < total_count
+                    "has_more": next_cursor is not None
                 },
-                "metadata": {
-                    "query_type": "fetch_logs_by_message_pattern",
-                    "processing_time_ms": 0,
-                    "confidence": 1.0
-                }
+                "metadata": _FETCH_METADATA["fetch_logs_by_message_pattern"]
             }
         except Exception as e:
             return {
@@ -148,49 +527,38 @@ class QueryTranslator:
                 "data": {"logs": [], "count": 0}
             }
     
-    def fetch_logs_by_container(self, db_session: Session, container: str, limit: int = 1000, offset: int = 0) -> Dict[str, Any]:
+    def fetch_logs_by_container(self, db_session: Session, container: str, limit: int = 1000, cursor: Optional[str] = None, include_total: bool = False) -> Dict[str, Any]:
         """
         Simple function to fetch logs by container name.
         
         Args:
             db_session: Database session
-            container: Container name or partial name
+            container: Container name, partial name, or prefix ending in '*'
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Also return total_count for the whole result set
             
         Returns:
             Dictionary with logs data and metadata
         """
         try:
-            # Get total count for this container
-            total_count = db_session.query(ContainerLogsModel)\
-                .filter(ContainerLogsModel.container.ilike(f"%{container}%"))\
-                .count()
-            
-            # Fetch logs with container filter
-            logs = db_session.query(ContainerLogsModel)\
-                .filter(ContainerLogsModel.container.ilike(f"%{container}%"))\
-                .order_by(desc(ContainerLogsModel.timestamp))\
-                .limit(limit)\
-                .offset(offset)\
-                .all()
+            # Fetch the page after the cursor
+            stmt = self._container_stmt(container)
+            logs, next_cursor = self._fetch_log_page(db_session, stmt, limit, cursor)
+            total_count = self._count_logs(db_session, stmt, ("container", container)) if include_total else None
             
             return {
                 "success": True,
                 "data": {
-                    "logs": [self._serialize_result(log) for log in logs],
+                    "logs": logs,
                     "count": len(logs),
                     "total_count": total_count,
                     "limit": limit,
-                    "offset": offset,
+                    "next_cursor": next_cursor,
                     "container_filter": container,
-                    "has_more": offset + len(logs) < total_count
+                    "has_more": next_cursor is not None
                 },
-                "metadata": {
-                    "query_type": "fetch_logs_by_container",
-                    "processing_time_ms": 0,
-                    "confidence": 1.0
-                }
+                "metadata": _FETCH_METADATA["fetch_logs_by_container"]
             }
         except Exception as e:
             return {
@@ -199,45 +567,35 @@ class QueryTranslator:
                 "data": {"logs": [], "count": 0}
             }
     
-    def fetch_latest_logs(self, db_session: Session, limit: int = 50) -> Dict[str, Any]:
+    def fetch_latest_logs(self, db_session: Session, limit: int = 50, include_total: bool = False) -> Dict[str, Any]:
         """
         Fetch the most recent logs ordered by timestamp.
         
         Args:
             db_session: SQLAlchemy database session
             limit: Maximum number of logs to return (default: 50)
+            include_total: Also return total_count for the whole result set (default: False)
             
         Returns:
             Dict containing success status, logs data, and metadata
         """
         try:
             # Query for the most recent logs ordered by timestamp descending
-            query = db_session.query(ContainerLogsModel).order_by(desc(ContainerLogsModel.timestamp))
-            
-            # Get total count
-            total_count = query.count()
-            
-            # Apply limit
-            logs = query.limit(limit).all()
-            
-            # Serialize results
-            serialized_logs = [self._serialize_result(log) for log in logs]
+            stmt = lambda_stmt(lambda: select(ContainerLogsModel.__table__))
+            logs, next_cursor = self._fetch_log_page(db_session, stmt, limit)
+            total_count = self._count_logs(db_session, stmt, ("all",)) if include_total else None
             
             return {
                 "success": True,
                 "data": {
-                    "logs": serialized_logs,
-                    "count": len(serialized_logs),
+                    "logs": logs,
+                    "count": len(logs),
                     "total_count": total_count,
                     "limit": limit,
-                    "offset": 0,
-                    "has_more": len(serialized_logs) < total_count
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None
                 },
-                "metadata": {
-                    "query_type": "fetch_latest_logs",
-                    "processing_time_ms": 0,
-                    "confidence": 1.0
-                }
+                "metadata": _FETCH_METADATA["fetch_latest_logs"]
             }
         except Exception as e:
             return {
@@ -246,56 +604,54 @@ class QueryTranslator:
                 "data": {"logs": [], "count": 0, "total_count": 0}
             }
     
-    def fetch_logs_last_hour(self, db_session: Session, limit: int = 1000, offset: int = 0) -> Dict[str, Any]:
+    def fetch_logs_last_hour(self, db_session: Session, limit: int = 1000, cursor: Optional[str] = None, include_total: bool = False) -> Dict[str, Any]:
         """
         Fetch all logs from the last hour.
         
         Args:
             db_session: SQLAlchemy database session
             limit: Maximum number of logs to return (default: 1000)
-            offset: Number of logs to skip (default: 0)
+            cursor: Opaque cursor from a previous page's next_cursor (default: None)
+            include_total: Also return total_count for the whole result set (default: False)
             
         Returns:
             Dict containing success status, logs data, and metadata
         """
         try:
-            # Calculate time one hour ago using timezone-aware datetime
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+            # Read the clock once so the filter and the reported window agree
+            now = datetime.now(timezone.utc)
+            one_hour_ago = now - _ONE_HOUR
             
             # Query for logs from the last hour
-            query = db_session.query(ContainerLogsModel).filter(
+            stmt = lambda_stmt(lambda: select(ContainerLogsModel.__table__).where(
                 ContainerLogsModel.timestamp >= one_hour_ago
-            ).order_by(desc(ContainerLogsModel.timestamp))
-            
-            # Get total count
-            total_count = query.count()
+            ))
             
             # Apply pagination
-            logs = query.offset(offset).limit(limit).all()
+            logs, next_cursor = self._fetch_log_page(db_session, stmt, limit, cursor)
             
-            # Serialize results
-            serialized_logs = [self._serialize_result(log) for log in logs]
+            # The window moves every call, so counts are cached per minute bucket
+            if include_total:
+                total_count = self._count_logs(db_session, stmt, ("last_hour", one_hour_ago.replace(second=0, microsecond=0)))
+            else:
+                total_count = None
             
             return {
                 "success": True,
                 "data": {
-                    "logs": serialized_logs,
-                    "count": len(serialized_logs),
+                    "logs": logs,
+                    "count": len(logs),
                     "total_count": total_count,
                     "limit": limit,
-                    "offset": offset,
+                    "next_cursor": next_cursor,
                     "time_filter": {
                         "start_time": one_hour_ago.isoformat(),
-                        "end_time": datetime.utcnow().isoformat(),
+                        "end_time": now.isoformat(),
                         "duration": "1 hour"
                     },
-                    "has_more": offset + len(serialized_logs) < total_count
+                    "has_more": next_cursor is not None
                 },
-                "metadata": {
-                    "query_type": "fetch_logs_last_hour",
-                    "processing_time_ms": 0,
-                    "confidence": 1.0
-                }
+                "metadata": _FETCH_METADATA["fetch_logs_last_hour"]
             }
         except Exception as e:
             return {
@@ -315,62 +671,23 @@ class QueryTranslator:
         Returns:
             Dict containing query results and metadata
         """
-        if parsed_query.intent == QueryIntent.SEARCH_LOGS:
-            return self._handle_search_logs(parsed_query, db_session)
-        elif parsed_query.intent == QueryIntent.SHOW_ALERTS:
-            return self._handle_show_alerts(parsed_query, db_session)
-        elif parsed_query.intent == QueryIntent.GENERATE_REPORT:
-            return self._handle_generate_report(parsed_query, db_session)
-        elif parsed_query.intent == QueryIntent.INVESTIGATE:
-            return self._handle_investigate(parsed_query, db_session)
-        elif parsed_query.intent == QueryIntent.ANALYZE_TRENDS:
-            return self._handle_analyze_trends(parsed_query, db_session)
-        # EMERGENCY FIX: Handle new analytics intents by mapping them to existing handlers
-        elif parsed_query.intent == QueryIntent.ANALYTICS_SUMMARY:
-            return self._handle_generate_report(parsed_query, db_session)  # Map to report generation
-        elif parsed_query.intent == QueryIntent.ANALYTICS_ANOMALIES:
-            return self._handle_show_alerts(parsed_query, db_session)  # Map to alerts
-        elif parsed_query.intent == QueryIntent.ANALYTICS_PERFORMANCE:
-            return self._handle_analyze_trends(parsed_query, db_session)  # Map to trends
-        elif parsed_query.intent == QueryIntent.ANALYTICS_METRICS:
-            return self._handle_analyze_trends(parsed_query, db_session)  # Map to trends
-        else:
+        handler = self.intent_handlers.get(parsed_query.intent)
+        if handler is None:
             return {
                 "error": f"Unsupported query intent: {parsed_query.intent}",
                 "suggestions": self._get_query_suggestions()
             }
+        return handler(self, parsed_query, db_session)
     
     def _handle_search_logs(self, parsed_query: ParsedQuery, db_session: Session) -> Dict[str, Any]:
         """Handle log search queries using PostgreSQL."""
         try:
-            # Check for time-based queries first
-            original_query = parsed_query.original_query.lower()
-            
-            # Check for latest logs patterns
-            latest_patterns = [
-                "latest logs", "recent logs", "newest logs", "most recent logs",
-                "show latest logs", "get latest logs", "display latest logs",
-                "show recent logs", "get recent logs", "display recent logs",
-                "latest 50", "recent 50", "last 50"
-            ]
-            
-            # Check for last hour patterns
-            last_hour_patterns = [
-                "last hour", "past hour", "previous hour", "logs from last hour",
-                "logs from past hour", "logs from previous hour", "hour ago",
-                "logs in the last hour", "logs in the past hour"
-            ]
-            
-            # Check for container-specific patterns
-            container_patterns = [
-                "container logs", "logs from container", "logs for container",
-                "show container", "get container", "display container",
-                "container logs for", "logs from container", "container"
-            ]
+            # Route the query once; the routing is cached per query string
+            route, container_name = _classify_search_intent(parsed_query.original_query.lower())
             
             # Handle time-based queries
-            if any(pattern in original_query for pattern in latest_patterns):
-                result = self.fetch_latest_logs(db_session, limit=50)
+            if route == "latest":
+                result = self.fetch_latest_logs(db_session, limit=50, include_total=True)
                 if result.get("success", False):
                     return {
                         "intent": "search_logs",
@@ -393,8 +710,8 @@ class QueryTranslator:
                         "fallback_attempted": True
                     }
             
-            if any(pattern in original_query for pattern in last_hour_patterns):
-                result = self.fetch_logs_last_hour(db_session, limit=1000)
+            if route == "last_hour":
+                result = self.fetch_logs_last_hour(db_session, limit=1000, include_total=True)
                 if result.get("success", False):
                     return {
                         "intent": "search_logs",
@@ -418,83 +735,69 @@ class QueryTranslator:
                     }
             
             # Handle container-specific queries with direct routing
-            if any(pattern in original_query for pattern in container_patterns):
-                # Extract container name from the query
-                container_name = self._extract_container_name_from_query(original_query)
-                if container_name:
-                    result = self.fetch_logs_by_container(db_session, container_name, limit=100)
-                    if result.get("success", False):
-                        return {
-                            "intent": "search_logs",
-                            "results": result["data"]["logs"],
-                            "count": result["data"]["total_count"],
-                            "data_source": "postgresql",
-                            "query_info": {
-                                "query_type": "container_logs",
-                                "container": container_name,
-                                "confidence": 0.9,
-                                "table_queried": "container_logs"
-                            }
-                        }
-                    else:
-                        return {
-                            "intent": "search_logs",
-                            "error": f"Failed to fetch container logs: {result.get('error', 'Unknown error')}",
-                            "results": [],
-                            "count": 0,
-                            "fallback_attempted": True
+            if route == "container":
+                result = self.fetch_logs_by_container(db_session, container_name, limit=100, include_total=True)
+                if result.get("success", False):
+                    return {
+                        "intent": "search_logs",
+                        "results": result["data"]["logs"],
+                        "count": result["data"]["total_count"],
+                        "data_source": "postgresql",
+                        "query_info": {
+                            "query_type": "container_logs",
+                            "container": container_name,
+                            "confidence": 0.9,
+                            "table_queried": "container_logs"
                         }
-            
-            # Check if this is a simple "show all logs" type query
-            show_all_patterns = [
-                "show all logs", "display all logs", "get all logs", "list all logs",
-                "show every log", "display every log", "get every log", "list every log",
-                "show me all logs", "show me every log", "all logs", "every log"
-            ]
-            
-            # Check for specific entity filters
-            has_container_filter = any(entity.type == EntityType.CONTAINER_NAME for entity in parsed_query.entities)
-            has_level_filter = any(entity.type == EntityType.LOG_LEVEL for entity in parsed_query.entities)
+                    }
+                else:
+                    return {
+                        "intent": "search_logs",
+                        "error": f"Failed to fetch container logs: {result.get('error', 'Unknown error')}",
+                        "results": [],
+                        "count": 0,
+                        "fallback_attempted": True
+                    }
             
             # Use simple functions for common queries
-            if any(pattern in original_query for pattern in show_all_patterns):
-                if has_container_filter:
-                    # Get container name from entities
-                    container_entity = next((entity for entity in parsed_query.entities if entity.type == EntityType.CONTAINER_NAME), None)
-                    if container_entity:
-                        result = self.fetch_logs_by_container(db_session, container_entity.value, limit=100)
-                        return {
-                            "intent": "search_logs",
-                            "results": result["data"]["logs"],
-                            "count": result["data"]["total_count"],
-                            "data_source": "postgresql",
-                            "query_info": {
-                                "query_type": "simple_container_filter",
-                                "container": container_entity.value,
-                                "confidence": 1.0,
-                                "table_queried": "container_logs"
-                            }
+            if route == "show_all":
+                # First entity of each type, found in one pass
+                entities_by_type = _first_entities_by_type(parsed_query.entities)
+                container_entity = entities_by_type.get(EntityType.CONTAINER_NAME)
+                level_entity = entities_by_type.get(EntityType.LOG_LEVEL)
+                
+                if container_entity:
+                    result = self.fetch_logs_by_container(db_session, container_entity.value, limit=100, include_total=True)
+                    return {
+                        "intent": "search_logs",
+                        "results": result["data"]["logs"],
+                        "count": result["data"]["total_count"],
+                        "data_source": "postgresql",
+                        "query_info": {
+                            "query_type": "simple_container_filter",
+                            "container": container_entity.value,
+                            "confidence": 1.0,
+                            "table_queried": "container_logs"
                         }
-                elif has_level_filter:
-                    # Get level from entities and search in message content
-                    level_entity = next((entity for entity in parsed_query.entities if entity.type == EntityType.LOG_LEVEL), None)
-                    if level_entity:
-                        result = self.fetch_logs_by_message_pattern(db_session, level_entity.value, limit=100)
-                        return {
-                            "intent": "search_logs",
-                            "results": result["data"]["logs"],
-                            "count": result["data"]["total_count"],
-                            "data_source": "postgresql",
-                            "query_info": {
-                                "query_type": "simple_message_pattern",
-                                "pattern": level_entity.value,
-                                "confidence": 1.0,
-                                "table_queried": "container_logs"
-                            }
+                    }
+                elif level_entity:
+                    # Search the level in message content
+                    result = self.fetch_logs_by_message_pattern(db_session, level_entity.value, limit=100, include_total=True)
+                    return {
+                        "intent": "search_logs",
+                        "results": result["data"]["logs"],
+                        "count": result["data"]["total_count"],
+                        "data_source": "postgresql",
+                        "query_info": {
+                            "query_type": "simple_message_pattern",
+                            "pattern": level_entity.value,
+                            "confidence": 1.0,
+                            "table_queried": "container_logs"
                         }
+                    }
                 else:
                     # Simple fetch all logs
-                    result = self.fetch_all_logs(db_session, limit=100)
+                    result = self.fetch_all_logs(db_session, limit=100, include_total=True)
                     return {
                         "intent": "search_logs",
                         "results": result["data"]["logs"],
@@ -509,13 +812,8 @@ class QueryTranslator:
             
             # General fallback for queries that don't match specific patterns
             # Return recent logs with basic filtering
-            if not any([
-                "error" in original_query.lower(),
-                "warning" in original_query.lower(), 
-                "alert" in original_query.lower(),
-                any(container in original_query.lower() for container in ["nginx", "postgres", "redis", "app", "web", "db", "api"])
-            ]):
-                result = self.fetch_latest_logs(db_session, limit=50)
+            if route == "recent":
+                result = self.fetch_latest_logs(db_session, limit=50, include_total=True)
                 if result["success"]:
                     return {
                         "intent": "search_logs",
@@ -546,14 +844,8 @@ class QueryTranslator:
             # Order by timestamp descending
             query = query.order_by(desc(model.timestamp))
             
-            # Get total count
-            total_count = query.count()
-            
-            # Limit results for display
-            results = query.limit(100).all()
-            
-            # Serialize results
-            serialized_results = [self._serialize_result(result) for result in results]
+            # Limit and serialize results for display; the total rides along as a window count
+            serialized_results, total_count = self._serialize_rows_with_total(query, 100)
             
             return {
                 "intent": "search_logs",
@@ -654,9 +946,8 @@ class QueryTranslator:
         time_range = parsed_query.structured_params.get("time_range")
         if not time_range:
             # Default to last week for reports
-            from datetime import timedelta
             now = datetime.now()
-            time_range = {"start": now - timedelta(weeks=1), "end": now}
+            time_range = {"start": now - _ONE_WEEK, "end": now}
         
         # Generate comprehensive security report
         report_data = {
@@ -665,12 +956,16 @@ class QueryTranslator:
                 "start": time_range["start"].isoformat(),
                 "end": time_range["end"].isoformat()
             },
-            "alerts_summary": self._generate_alerts_summary(db_session, time_range),
-            "docker_events_summary": self._generate_docker_summary(db_session, time_range),
-            "log_analysis": self._generate_log_analysis(db_session, time_range),
-            "metrics_overview": self._generate_metrics_overview(db_session, time_range),
-            "recommendations": self._generate_recommendations(db_session, time_range)
+            **self._run_sections_concurrently(db_session, time_range, (
+                ("alerts_summary", self._generate_alerts_summary),
+                ("docker_events_summary", self._generate_docker_summary),
+                ("log_analysis", self._generate_log_analysis),
+                ("metrics_overview", self._generate_metrics_overview)
+            ))
         }
+        report_data["recommendations"] = self._generate_recommendations(
+            report_data["alerts_summary"], report_data["log_analysis"]
+        )
         
         return {
             "intent": "generate_report",
@@ -684,21 +979,27 @@ class QueryTranslator:
     def _handle_investigate(self, parsed_query: ParsedQuery, db_session: Session) -> Dict[str, Any]:
         """Handle investigation queries."""
         filters = parsed_query.structured_params.get("filters", {})
-        investigation_results = {}
+        investigations = []
         
         # IP address investigation
         if "ip_address" in filters:
             ip_address = filters["ip_address"]
-            investigation_results["ip_analysis"] = self._investigate_ip_address(
-                db_session, ip_address, parsed_query
-            )
+            investigations.append(("ip_analysis", lambda session: self._investigate_ip_address(
+                session, ip_address, parsed_query
+            )))
         
         # Container investigation
         if "container" in filters:
             container = filters["container"]
-            investigation_results["container_analysis"] = self._investigate_container(
-                db_session, container, parsed_query
-            )
+            investigations.append(("container_analysis", lambda session: self._investigate_container(
+                session, container, parsed_query
+            )))
+        
+        # IP and container investigations are independent, so run both at once
+        if len(investigations) > 1:
+            investigation_results = self._run_concurrently(db_session, investigations)
+        else:
+            investigation_results = {name: investigate(db_session) for name, investigate in investigations}
         
         # General security investigation
         if not investigation_results:
@@ -721,16 +1022,15 @@ class QueryTranslator:
         time_range = parsed_query.structured_params.get("time_range")
         if not time_range:
             # Default to last month for trends
-            from datetime import timedelta
             now = datetime.now()
-            time_range = {"start": now - timedelta(days=30), "end": now}
+            time_range = {"start": now - _THIRTY_DAYS, "end": now}
         
-        trends_data = {
-            "alert_trends": self._analyze_alert_trends(db_session, time_range),
-            "docker_activity_trends": self._analyze_docker_trends(db_session, time_range),
-            "log_volume_trends": self._analyze_log_trends(db_session, time_range),
-            "metrics_trends": self._analyze_metrics_trends(db_session, time_range)
-        }
+        trends_data = self._run_sections_concurrently(db_session, time_range, (
+            ("alert_trends", self._analyze_alert_trends),
+            ("docker_activity_trends", self._analyze_docker_trends),
+            ("log_volume_trends", self._analyze_log_trends),
+            ("metrics_trends", self._analyze_metrics_trends)
+        ))
         
         return {
             "intent": "analyze_trends",
@@ -741,6 +1041,52 @@ class QueryTranslator:
             }
         }
     
+    def _run_concurrently(self, db_session: Session, tasks) -> Dict[str, Any]:
+        """
+        Run independent (name, task_fn) calls on the shared pool.
+        
+        Each task_fn is called with its own session on the caller's engine,
+        since a Session must not be shared between threads. Results keep the
+        order of tasks and a failing task re-raises its exception here.
+        """
+        bind = db_session.get_bind()
+        
+        def run_task(task_fn):
+            with Session(bind=bind) as task_session:
+                return task_fn(task_session)
+        
+        futures = [(name, _REPORT_POOL.submit(run_task, task_fn)) for name, task_fn in tasks]
+        return {name: future.result() for name, future in futures}
+    
+    def _run_sections_concurrently(self, db_session: Session, time_range: Optional[Dict[str, datetime]], sections) -> Dict[str, Any]:
+        """Run independent (name, section_fn) report sections concurrently, reusing cached results."""
+        return self._run_concurrently(db_session, [
+            (name, lambda session, section_fn=section_fn: self._cached_section(section_fn, session, time_range))
+            for name, section_fn in sections
+        ])
+    
+    def _cached_section(self, section_fn, db_session: Session, time_range: Optional[Dict[str, datetime]]) -> Any:
+        """
+        Return section_fn(db_session, time_range), reusing a recent result.
+        
+        Only ranges that ended before now minus _SECTION_CACHE_SETTLE_TIME are
+        cached, since newer ranges can still gain rows between refreshes.
+        """
+        if not time_range:
+            return section_fn(db_session, time_range)
+        end = time_range["end"]
+        if end >= datetime.now(end.tzinfo) - _SECTION_CACHE_SETTLE_TIME:
+            return section_fn(db_session, time_range)
+        
+        cache_key = (section_fn.__name__, time_range["start"], end)
+        with self._section_lock:
+            result = self.section_cache.get(cache_key)
+        if result is None:
+            result = section_fn(db_session, time_range)
+            with self._section_lock:
+                self.section_cache[cache_key] = result
+        return result
+    
     def _determine_log_table(self, parsed_query: ParsedQuery) -> Any:
         """Determine which table to query based on the parsed query."""
         filters = parsed_query.structured_params.get("filters", {})
@@ -759,81 +1105,61 @@ class QueryTranslator:
     def _apply_filters(self, query, parsed_query: ParsedQuery, model) -> Any:
         """Apply filters to the query based on parsed entities."""
         filters = parsed_query.structured_params.get("filters", {})
+        columns = _MODEL_COLUMNS[model]
         
-        if hasattr(model, 'container') and "container" in filters:
-            query = query.filter(model.container.ilike(f"%{filters['container']}%"))
-        
-        if hasattr(model, 'message') and "log_level" in filters:
-            log_level = filters["log_level"]
-            query = query.filter(model.message.ilike(f"%{log_level}%"))
+        # Conditions are ANDed cheapest first: equality, then substring matches on
+        # the short indexed columns, then the message text matches
+        conditions = []
         
-        if hasattr(model, 'severity') and "severity" in filters:
-            query = query.filter(model.severity == filters["severity"])
+        if "severity" in columns and "severity" in filters:
+            conditions.append(model.severity == filters["severity"])
         
-        if hasattr(model, 'type') and "event_type" in filters:
-            query = query.filter(model.type.ilike(f"%{filters['event_type']}%"))
+        if "container" in columns and "container" in filters:
+            conditions.append(model.container.ilike(f"%{filters['container']}%"))
         
-        # Add text search for specific queries only (not general "show all logs" type queries)
-        search_terms = self._extract_search_terms(parsed_query.original_query)
-        meaningful_search_terms = self._filter_meaningful_search_terms(search_terms, parsed_query.original_query)
-        
-        if meaningful_search_terms and hasattr(model, 'message'):
-            search_conditions = []
-            for term in meaningful_search_terms:
-                search_conditions.append(model.message.ilike(f"%{term}%"))
-            if search_conditions:
-                query = query.filter(or_(*search_conditions))
+        if "type" in columns and "event_type" in filters:
+            conditions.append(model.type.ilike(f"%{filters['event_type']}%"))
         
+        if "message" in columns:
+            if "log_level" in filters:
+                log_level = filters["log_level"]
+                conditions.append(model.message.ilike(f"%{log_level}%"))
+            
+            # Add text search for specific queries only (not general "show all logs" type queries)
+            search_terms = _extract_search_terms_cached(parsed_query.original_query)
+            meaningful_search_terms = self._filter_meaningful_search_terms(search_terms, parsed_query.original_query)
+            
+            if len(meaningful_search_terms) == 1:
+                conditions.append(model.message.ilike(f"%{meaningful_search_terms[0]}%"))
+            elif meaningful_search_terms:
+                # One regex alternation scans each message once instead of once per term
+                terms_regex = _search_terms_regex(tuple(meaningful_search_terms))
+                conditions.append(model.message.op("~*")(terms_regex))
+        
+        if conditions:
+            query = query.filter(*conditions)
         return query
     
     def _apply_time_filter(self, query, parsed_query: ParsedQuery, model) -> Any:
         """Apply time range filter to the query."""
         time_range = parsed_query.structured_params.get("time_range")
-        if time_range and hasattr(model, 'timestamp'):
-            query = query.filter(
-                and_(
-                    model.timestamp >= time_range["start"],
-                    model.timestamp <= time_range["end"]
-                )
-            )
+        if time_range and "timestamp" in _MODEL_COLUMNS[model]:
+            query = query.filter(_time_range_filter(model, time_range))
         return query
     
     def _extract_search_terms(self, query: str) -> List[str]:
         """Extract search terms from the original query."""
-        # Remove common words and extract meaningful terms
-        stop_words = {
-            "show", "me", "all", "the", "in", "from", "with", "and", "or", "of",
-            "to", "for", "on", "at", "by", "is", "are", "was", "were", "been",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "can", "must", "shall", "a", "an", "this",
-            "that", "these", "those"
-        }
-        
-        words = query.lower().split()
-        search_terms = [word for word in words if word not in stop_words and len(word) > 2]
-        
-        # Filter out time-related words that are already handled
-        time_words = {"hour", "day", "week", "month", "today", "yesterday", "last", "past"}
-        search_terms = [term for term in search_terms if term not in time_words]
-        
-        return search_terms[:5]  # Limit to 5 terms
+        return list(_extract_search_terms_cached(query))
     
     def _filter_meaningful_search_terms(self, search_terms: List[str], original_query: str) -> List[str]:
         """Filter out generic log-related terms that shouldn't trigger text search."""
-        # Generic terms that indicate "show all" rather than specific search
-        generic_terms = {
-            "logs", "log", "entries", "entry", "events", "event", "data", "records", 
-            "record", "messages", "message", "items", "item", "everything", "every",
-            "container", "containers", "docker", "system"
-        }
-        
         # If the query contains words like "all", "every", "everything" and only generic terms,
         # it's likely a "show all" query rather than a specific search
         query_lower = original_query.lower()
         has_show_all_intent = any(word in query_lower for word in ["all", "every", "everything"])
         
         # Filter out generic terms
-        meaningful_terms = [term for term in search_terms if term not in generic_terms]
+        meaningful_terms = [term for term in search_terms if term not in _GENERIC_LOG_TERMS]
         
         # If we have show-all intent and only generic terms remain, return empty list
         if has_show_all_intent and not meaningful_terms:
@@ -844,16 +1170,45 @@ class QueryTranslator:
     def _serialize_result(self, result) -> Dict[str, Any]:
         """Serialize a database result to a dictionary."""
         if hasattr(result, '__dict__'):
-            data = {}
-            for column in result.__table__.columns:
-                value = getattr(result, column.name)
-                if isinstance(value, datetime):
-                    data[column.name] = value.isoformat()
-                else:
-                    data[column.name] = value
-            return data
+            return _model_serializer(type(result))(result)
         return str(result)
     
+    def _serialize_rows(self, query, limit: int) -> List[Dict[str, Any]]:
+        """
+        Serialize up to limit rows of a single-model ORM query as they are fetched.
+        
+        The model's table columns are selected as plain rows, so no ORM
+        instances or identity-map entries are built for read-only output.
+        Batches larger than _STREAM_BATCH_SIZE are streamed with yield_per,
+        matching _fetch_log_page.
+        """
+        model = query.column_descriptions[0]["entity"]
+        query = query.with_entities(*model.__table__.columns).limit(limit)
+        if limit > _STREAM_BATCH_SIZE:
+            query = query.yield_per(_STREAM_BATCH_SIZE)
+        serialize = _values_serializer(model)
+        return [serialize(row) for row in query]
+    
+    def _serialize_rows_with_total(self, query, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Serialize up to limit rows of a single-model ORM query plus its full row count.
+        
+        The count is COUNT(*) OVER () on the same statement, so the total and
+        the page come back in one round-trip instead of a separate COUNT query.
+        """
+        model = query.column_descriptions[0]["entity"]
+        query = query.with_entities(*model.__table__.columns, func.count().over()).limit(limit)
+        if limit > _STREAM_BATCH_SIZE:
+            query = query.yield_per(_STREAM_BATCH_SIZE)
+        serialize = _values_serializer(model)
+        
+        results = []
+        total_count = 0
+        for row in query:
+            results.append(serialize(row[:-1]))
+            total_count = row[-1]
+        return results, total_count
+    
     def _get_applied_filters(self, parsed_query: ParsedQuery) -> Dict[str, Any]:
         """Get a summary of applied filters."""
         return {
@@ -868,13 +1223,7 @@ class QueryTranslator:
         base_query = db_session.query(AlertsModel)
         base_query = self._apply_time_filter(base_query, parsed_query, AlertsModel)
         
-        total_alerts = base_query.count()
-        resolved_alerts = base_query.filter(AlertsModel.resolved == True).count()
-        
-        severity_counts = {}
-        for severity in ["LOW", "MEDIUM", "HIGH"]:
-            count = base_query.filter(AlertsModel.severity == severity).count()
-            severity_counts[severity] = count
+        total_alerts, resolved_alerts, severity_counts = self._count_alerts_by_severity(base_query)
         
         return {
             "total_alerts": total_alerts,
@@ -884,21 +1233,32 @@ class QueryTranslator:
             "resolution_rate": (resolved_alerts / total_alerts * 100) if total_alerts > 0 else 0
         }
     
+    def _count_alerts_by_severity(self, query) -> Tuple[int, int, Dict[str, int]]:
+        """
+        Count alerts in total, resolved, and per severity with one GROUP BY query.
+        
+        Returns:
+            Tuple of (total, resolved, counts for LOW/MEDIUM/HIGH)
+        """
+        rows = query.with_entities(AlertsModel.severity, AlertsModel.resolved, func.count())\
+            .group_by(AlertsModel.severity, AlertsModel.resolved)\
+            .all()
+        
+        total = resolved = 0
+        severity_counts = {"LOW": 0, "MEDIUM": 0, "HIGH": 0}
+        for severity, is_resolved, count in rows:
+            total += count
+            if is_resolved:
+                resolved += count
+            if severity in severity_counts:
+                severity_counts[severity] += count
+        return total, resolved, severity_counts
+    
     def _generate_alerts_summary(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Generate alerts summary for reports."""
-        query = db_session.query(AlertsModel).filter(
-            and_(
-                AlertsModel.timestamp >= time_range["start"],
-                AlertsModel.timestamp <= time_range["end"]
-            )
-        )
-        
-        total = query.count()
-        by_severity = {}
-        for severity in ["LOW", "MEDIUM", "HIGH"]:
-            by_severity[severity] = query.filter(AlertsModel.severity == severity).count()
+        query = db_session.query(AlertsModel).filter(_time_range_filter(AlertsModel, time_range))
         
-        resolved = query.filter(AlertsModel.resolved == True).count()
+        total, resolved, by_severity = self._count_alerts_by_severity(query)
         
         return {
             "total_alerts": total,
@@ -910,29 +1270,14 @@ class QueryTranslator:
     
     def _generate_docker_summary(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Generate Docker events summary for reports."""
-        query = db_session.query(DockerEventsModel).filter(
-            and_(
-                DockerEventsModel.timestamp >= time_range["start"],
-                DockerEventsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(DockerEventsModel).filter(_time_range_filter(DockerEventsModel, time_range))
         
-        total_events = query.count()
-        
-        # Count by action type
-        action_counts = {}
-        actions = db_session.query(DockerEventsModel.action).filter(
-            and_(
-                DockerEventsModel.timestamp >= time_range["start"],
-                DockerEventsModel.timestamp <= time_range["end"]
-            )
-        ).distinct().all()
-        
-        for action_tuple in actions:
-            action = action_tuple[0]
-            if action:
-                count = query.filter(DockerEventsModel.action == action).count()
-                action_counts[action] = count
+        # Count by action type; the total includes events without an action
+        action_rows = query.with_entities(DockerEventsModel.action, func.count())\
+            .group_by(DockerEventsModel.action)\
+            .all()
+        total_events = sum(count for _, count in action_rows)
+        action_counts = {action: count for action, count in action_rows if action}
         
         return {
             "total_events": total_events,
@@ -942,19 +1287,17 @@ class QueryTranslator:
     
     def _generate_log_analysis(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Generate log analysis for reports."""
-        query = db_session.query(ContainerLogsModel).filter(
-            and_(
-                ContainerLogsModel.timestamp >= time_range["start"],
-                ContainerLogsModel.timestamp <= time_range["end"]
-            )
-        )
-        
-        total_logs = query.count()
-        unique_containers = query.with_entities(ContainerLogsModel.container).distinct().count()
-        
-        # Estimate log levels (simple keyword matching)
-        error_logs = query.filter(ContainerLogsModel.message.ilike('%error%')).count()
-        warn_logs = query.filter(ContainerLogsModel.message.ilike('%warn%')).count()
+        query = db_session.query(ContainerLogsModel).filter(_time_range_filter(ContainerLogsModel, time_range))
+        
+        # Estimate log levels (simple keyword matching) in the same pass as the total
+        total_logs, error_logs, warn_logs = query.with_entities(
+            func.count(),
+            func.count().filter(ContainerLogsModel.message.ilike('%error%')),
+            func.count().filter(ContainerLogsModel.message.ilike('%warn%'))
+        ).one()
+        unique_containers = db_session.execute(
+            _DISTINCT_LOG_CONTAINERS_SQL, {"start": time_range["start"], "end": time_range["end"]}
+        ).scalar_one()
         
         return {
             "total_log_entries": total_logs,
@@ -966,65 +1309,41 @@ class QueryTranslator:
     
     def _generate_metrics_overview(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Generate metrics overview for reports."""
-        query = db_session.query(MetricsModel).filter(
-            and_(
-                MetricsModel.timestamp >= time_range["start"],
-                MetricsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(MetricsModel).filter(_time_range_filter(MetricsModel, time_range))
         
-        if query.count() == 0:
-            return {"message": "No metrics data available for this time period"}
+        # Calculate averages and the row count in one pass
+        avg_cpu, avg_memory, avg_disk, data_points = query.with_entities(
+            func.avg(MetricsModel.cpu_usage),
+            func.avg(MetricsModel.memory_usage),
+            func.avg(MetricsModel.disk_usage),
+            func.count()
+        ).one()
         
-        # Calculate averages
-        avg_cpu = query.with_entities(func.avg(MetricsModel.cpu_usage)).scalar() or 0
-        avg_memory = query.with_entities(func.avg(MetricsModel.memory_usage)).scalar() or 0
-        avg_disk = query.with_entities(func.avg(MetricsModel.disk_usage)).scalar() or 0
+        if data_points == 0:
+            return {"message": "No metrics data available for this time period"}
         
         return {
-            "average_cpu_usage": round(float(avg_cpu), 2),
-            "average_memory_usage": round(float(avg_memory), 2),
-            "average_disk_usage": round(float(avg_disk), 2),
-            "data_points": query.count()
+            "average_cpu_usage": round(float(avg_cpu or 0), 2),
+            "average_memory_usage": round(float(avg_memory or 0), 2),
+            "average_disk_usage": round(float(avg_disk or 0), 2),
+            "data_points": data_points
         }
     
-    def _generate_recommendations(self, db_session: Session, time_range: Dict[str, datetime]) -> List[str]:
-        """Generate security recommendations based on the data."""
+    def _generate_recommendations(self, alerts_summary: Dict[str, Any], log_analysis: Dict[str, Any]) -> List[str]:
+        """Generate security recommendations from the report's alert and log sections."""
         recommendations = []
+        alert_count = alerts_summary["total_alerts"]
         
         # Check for high alert volume
-        alert_count = db_session.query(AlertsModel).filter(
-            and_(
-                AlertsModel.timestamp >= time_range["start"],
-                AlertsModel.timestamp <= time_range["end"]
-            )
-        ).count()
-        
         if alert_count > 100:
             recommendations.append("High alert volume detected. Consider reviewing alert thresholds.")
         
         # Check resolution rate
-        resolved_count = db_session.query(AlertsModel).filter(
-            and_(
-                AlertsModel.timestamp >= time_range["start"],
-                AlertsModel.timestamp <= time_range["end"],
-                AlertsModel.resolved == True
-            )
-        ).count()
-        
-        if alert_count > 0 and (resolved_count / alert_count) < 0.5:
+        if alert_count > 0 and (alerts_summary["resolved"] / alert_count) < 0.5:
             recommendations.append("Low alert resolution rate. Consider improving incident response processes.")
         
         # Check for error patterns
-        error_logs = db_session.query(ContainerLogsModel).filter(
-            and_(
-                ContainerLogsModel.timestamp >= time_range["start"],
-                ContainerLogsModel.timestamp <= time_range["end"],
-                ContainerLogsModel.message.ilike('%error%')
-            )
-        ).count()
-        
-        if error_logs > 50:
+        if log_analysis["estimated_errors"] > 50:
             recommendations.append("High error log volume detected. Review application health and error handling.")
         
         if not recommendations:
@@ -1035,35 +1354,26 @@ class QueryTranslator:
     def _investigate_ip_address(self, db_session: Session, ip_address: str, parsed_query: ParsedQuery) -> Dict[str, Any]:
         """Investigate activities related to a specific IP address."""
         time_range = parsed_query.structured_params.get("time_range")
+        ip_pattern = f'%{ip_address}%'
         
         # Search in container logs
         log_query = db_session.query(ContainerLogsModel)
         if time_range:
-            log_query = log_query.filter(
-                and_(
-                    ContainerLogsModel.timestamp >= time_range["start"],
-                    ContainerLogsModel.timestamp <= time_range["end"]
-                )
-            )
+            log_query = log_query.filter(_time_range_filter(ContainerLogsModel, time_range))
         
-        ip_logs = log_query.filter(ContainerLogsModel.message.ilike(f'%{ip_address}%')).limit(20).all()
+        ip_logs = self._serialize_rows(log_query.filter(ContainerLogsModel.message.ilike(ip_pattern)), 20)
         
         # Search in alerts
         alert_query = db_session.query(AlertsModel)
         if time_range:
-            alert_query = alert_query.filter(
-                and_(
-                    AlertsModel.timestamp >= time_range["start"],
-                    AlertsModel.timestamp <= time_range["end"]
-                )
-            )
+            alert_query = alert_query.filter(_time_range_filter(AlertsModel, time_range))
         
-        ip_alerts = alert_query.filter(AlertsModel.message.ilike(f'%{ip_address}%')).limit(10).all()
+        ip_alerts = self._serialize_rows(alert_query.filter(AlertsModel.message.ilike(ip_pattern)), 10)
         
         return {
             "ip_address": ip_address,
-            "related_logs": [self._serialize_result(log) for log in ip_logs],
-            "related_alerts": [self._serialize_result(alert) for alert in ip_alerts],
+            "related_logs": ip_logs,
+            "related_alerts": ip_alerts,
             "log_count": len(ip_logs),
             "alert_count": len(ip_alerts),
             "risk_assessment": "HIGH" if len(ip_alerts) > 0 else "MEDIUM" if len(ip_logs) > 5 else "LOW"
@@ -1072,41 +1382,38 @@ class QueryTranslator:
     def _investigate_container(self, db_session: Session, container: str, parsed_query: ParsedQuery) -> Dict[str, Any]:
         """Investigate activities related to a specific container."""
         time_range = parsed_query.structured_params.get("time_range")
+        container_pattern = f'%{container}%'
         
         # Container logs
         log_query = db_session.query(ContainerLogsModel).filter(
-            ContainerLogsModel.container.ilike(f'%{container}%')
+            ContainerLogsModel.container.ilike(container_pattern)
         )
         if time_range:
-            log_query = log_query.filter(
-                and_(
-                    ContainerLogsModel.timestamp >= time_range["start"],
-                    ContainerLogsModel.timestamp <= time_range["end"]
-                )
-            )
+            log_query = log_query.filter(_time_range_filter(ContainerLogsModel, time_range))
         
-        container_logs = log_query.limit(20).all()
-        error_logs = log_query.filter(ContainerLogsModel.message.ilike('%error%')).count()
+        # Full and error counts ride along with the limited rows as window aggregates
+        log_rows = log_query.add_columns(
+            func.count().over().label("total_logs"),
+            func.count().filter(ContainerLogsModel.message.ilike('%error%')).over().label("error_logs")
+        ).limit(20).all()
+        container_logs = [self._serialize_result(row[0]) for row in log_rows]
+        total_logs = log_rows[0].total_logs if log_rows else 0
+        error_logs = log_rows[0].error_logs if log_rows else 0
         
         # Docker events
         event_query = db_session.query(DockerEventsModel).filter(
-            DockerEventsModel.container.ilike(f'%{container}%')
+            DockerEventsModel.container.ilike(container_pattern)
         )
         if time_range:
-            event_query = event_query.filter(
-                and_(
-                    DockerEventsModel.timestamp >= time_range["start"],
-                    DockerEventsModel.timestamp <= time_range["end"]
-                )
-            )
+            event_query = event_query.filter(_time_range_filter(DockerEventsModel, time_range))
         
-        container_events = event_query.limit(10).all()
+        container_events = self._serialize_rows(event_query, 10)
         
         return {
             "container": container,
-            "recent_logs": [self._serialize_result(log) for log in container_logs],
-            "recent_events": [self._serialize_result(event) for event in container_events],
-            "total_logs": log_query.count(),
+            "recent_logs": container_logs,
+            "recent_events": container_events,
+            "total_logs": total_logs,
             "error_logs": error_logs,
             "health_status": "UNHEALTHY" if error_logs > 10 else "HEALTHY"
         }
@@ -1115,59 +1422,50 @@ class QueryTranslator:
         """Perform general security investigation."""
         time_range = parsed_query.structured_params.get("time_range")
         
-        # Recent high severity alerts
+        return {
+            **self._run_sections_concurrently(db_session, time_range, (
+                ("high_severity_alerts", self._recent_high_severity_alerts),
+                ("recent_errors", self._recent_error_logs),
+                ("security_score", self._calculate_security_score)
+            )),
+            "recommendations": [
+                "Monitor high severity alerts closely",
+                "Investigate recurring error patterns",
+                "Review access logs for suspicious activity"
+            ]
+        }
+    
+    def _recent_high_severity_alerts(self, db_session: Session, time_range: Optional[Dict[str, datetime]]) -> List[Dict[str, Any]]:
+        """Return the 5 newest HIGH severity alerts in time_range."""
         alert_query = db_session.query(AlertsModel).filter(AlertsModel.severity == "HIGH")
         if time_range:
-            alert_query = alert_query.filter(
-                and_(
-                    AlertsModel.timestamp >= time_range["start"],
-                    AlertsModel.timestamp <= time_range["end"]
-                )
-            )
+            alert_query = alert_query.filter(_time_range_filter(AlertsModel, time_range))
         
-        high_alerts = alert_query.order_by(desc(AlertsModel.timestamp)).limit(5).all()
-        
-        # Recent error logs
+        return self._serialize_rows(alert_query.order_by(desc(AlertsModel.timestamp)), 5)
+    
+    def _recent_error_logs(self, db_session: Session, time_range: Optional[Dict[str, datetime]]) -> List[Dict[str, Any]]:
+        """Return the 10 newest container logs mentioning "error" in time_range."""
         log_query = db_session.query(ContainerLogsModel).filter(
             ContainerLogsModel.message.ilike('%error%')
         )
         if time_range:
-            log_query = log_query.filter(
-                and_(
-                    ContainerLogsModel.timestamp >= time_range["start"],
-                    ContainerLogsModel.timestamp <= time_range["end"]
-                )
-            )
-        
-        error_logs = log_query.order_by(desc(ContainerLogsModel.timestamp)).limit(10).all()
+            log_query = log_query.filter(_time_range_filter(ContainerLogsModel, time_range))
         
-        return {
-            "high_severity_alerts": [self._serialize_result(alert) for alert in high_alerts],
-            "recent_errors": [self._serialize_result(log) for log in error_logs],
-            "security_score": self._calculate_security_score(db_session, time_range),
-            "recommendations": [
-                "Monitor high severity alerts closely",
-                "Investigate recurring error patterns",
-                "Review access logs for suspicious activity"
-            ]
-        }
+        return self._serialize_rows(log_query.order_by(desc(ContainerLogsModel.timestamp)), 10)
     
     def _calculate_security_score(self, db_session: Session, time_range: Optional[Dict[str, datetime]]) -> int:
         """Calculate a simple security score (0-100)."""
         score = 100
         
-        # Check alerts
-        alert_query = db_session.query(AlertsModel)
+        # Check alerts; both severities are counted in one pass with FILTER
+        alert_query = db_session.query(
+            func.count().filter(AlertsModel.severity == "HIGH"),
+            func.count().filter(AlertsModel.severity == "MEDIUM")
+        )
         if time_range:
-            alert_query = alert_query.filter(
-                and_(
-                    AlertsModel.timestamp >= time_range["start"],
-                    AlertsModel.timestamp <= time_range["end"]
-                )
-            )
+            alert_query = alert_query.filter(_time_range_filter(AlertsModel, time_range))
         
-        high_alerts = alert_query.filter(AlertsModel.severity == "HIGH").count()
-        medium_alerts = alert_query.filter(AlertsModel.severity == "MEDIUM").count()
+        high_alerts, medium_alerts = alert_query.one()
         
         # Deduct points for alerts
         score -= high_alerts * 10
@@ -1175,14 +1473,10 @@ class QueryTranslator:
         
         # Check error rate
         if time_range:
-            log_query = db_session.query(ContainerLogsModel).filter(
-                and_(
-                    ContainerLogsModel.timestamp >= time_range["start"],
-                    ContainerLogsModel.timestamp <= time_range["end"]
-                )
-            )
-            total_logs = log_query.count()
-            error_logs = log_query.filter(ContainerLogsModel.message.ilike('%error%')).count()
+            total_logs, error_logs = db_session.query(
+                func.count(),
+                func.count().filter(ContainerLogsModel.message.ilike('%error%'))
+            ).filter(_time_range_filter(ContainerLogsModel, time_range)).one()
             
             if total_logs > 0:
                 error_rate = error_logs / total_logs
@@ -1195,12 +1489,7 @@ class QueryTranslator:
         # This is a simplified implementation
         # In a real system, you'd want to group by time periods and show trends
         
-        query = db_session.query(AlertsModel).filter(
-            and_(
-                AlertsModel.timestamp >= time_range["start"],
-                AlertsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(AlertsModel).filter(_time_range_filter(AlertsModel, time_range))
         
         total_alerts = query.count()
         daily_average = total_alerts / max(1, (time_range["end"] - time_range["start"]).days)
@@ -1213,12 +1502,7 @@ class QueryTranslator:
     
     def _analyze_docker_trends(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Analyze Docker activity trends."""
-        query = db_session.query(DockerEventsModel).filter(
-            and_(
-                DockerEventsModel.timestamp >= time_range["start"],
-                DockerEventsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(DockerEventsModel).filter(_time_range_filter(DockerEventsModel, time_range))
         
         total_events = query.count()
         daily_average = total_events / max(1, (time_range["end"] - time_range["start"]).days)
@@ -1231,12 +1515,7 @@ class QueryTranslator:
     
     def _analyze_log_trends(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Analyze log volume trends."""
-        query = db_session.query(ContainerLogsModel).filter(
-            and_(
-                ContainerLogsModel.timestamp >= time_range["start"],
-                ContainerLogsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(ContainerLogsModel).filter(_time_range_filter(ContainerLogsModel, time_range))
         
         total_logs = query.count()
         daily_average = total_logs / max(1, (time_range["end"] - time_range["start"]).days)
@@ -1249,69 +1528,42 @@ class QueryTranslator:
     
     def _analyze_metrics_trends(self, db_session: Session, time_range: Dict[str, datetime]) -> Dict[str, Any]:
         """Analyze system metrics trends."""
-        query = db_session.query(MetricsModel).filter(
-            and_(
-                MetricsModel.timestamp >= time_range["start"],
-                MetricsModel.timestamp <= time_range["end"]
-            )
-        )
+        query = db_session.query(MetricsModel).filter(_time_range_filter(MetricsModel, time_range))
         
-        if query.count() == 0:
-            return {"message": "No metrics data available"}
+        avg_cpu, avg_memory, data_points = query.with_entities(
+            func.avg(MetricsModel.cpu_usage),
+            func.avg(MetricsModel.memory_usage),
+            func.count()
+        ).one()
         
-        avg_cpu = query.with_entities(func.avg(MetricsModel.cpu_usage)).scalar() or 0
-        avg_memory = query.with_entities(func.avg(MetricsModel.memory_usage)).scalar() or 0
+        if data_points == 0:
+            return {"message": "No metrics data available"}
         
         return {
-            "average_cpu": round(float(avg_cpu), 2),
-            "average_memory": round(float(avg_memory), 2),
+            "average_cpu": round(float(avg_cpu or 0), 2),
+            "average_memory": round(float(avg_memory or 0), 2),
             "trend": "stable"
         }
     
-    def _extract_container_name_from_query(self, query: str) -> Optional[str]:
-        """
-        Extract container name from natural language query.
-        
-        Args:
-            query: The natural language query string
-            
-        Returns:
-            Container name if found, None otherwise
-        """
-        import re
-        
-        # Common patterns for container names in queries
-        patterns = [
-            r'container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "container webapp"
-            r'from\s+container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "from container webapp"
-            r'for\s+container\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "for container webapp"
-            r'([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])\s+container',  # "webapp container"
-            r'logs\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "logs webapp"
-            r'show\s+([a-zA-Z0-9][a-zA-Z0-9_.-]*[a-zA-Z0-9])',  # "show webapp"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                container_name = match.group(1)
-                # Filter out common words that aren't container names
-                if container_name.lower() not in ['logs', 'all', 'recent', 'latest', 'show', 'get', 'display', 'from', 'for', 'the', 'a', 'an']:
-                    return container_name
-        
-        return None
-
+    def _analytics_time_period(self, parsed_query: ParsedQuery) -> str:
+        """Map a query with a time range to an analytics period ("1h", "7d", "30d"), else "24h"."""
+        # Parser queries carry the range in structured_params; the simple NLP system's
+        # MockParsedQuery only has a time_range attribute
+        structured_params = getattr(parsed_query, "structured_params", None)
+        if structured_params is not None:
+            time_range = structured_params.get("time_range")
+        else:
+            time_range = getattr(parsed_query, "time_range", None)
+        if not time_range:
+            return "24h"
+        query_lower = parsed_query.original_query.lower()
+        return next((period for keyword, period in _TIME_PERIOD_KEYWORDS if keyword in query_lower), "24h")
+    
     def _handle_analytics_summary(self, parsed_query: ParsedQuery, db_session: Session) -> Dict[str, Any]:
         """Handle analytics summary requests."""
         try:
             # Extract time period from query
-            time_period = "24h"  # default
-            if parsed_query.time_range:
-                if "week" in parsed_query.original_query.lower():
-                    time_period = "7d"
-                elif "month" in parsed_query.original_query.lower():
-                    time_period = "30d"
-                elif "hour" in parsed_query.original_query.lower():
-                    time_period = "1h"
+            time_period = self._analytics_time_period(parsed_query)
             
             # Get summary from analytics service
             summary = summary_service.get_system_summary(db_session, time_period)
@@ -1338,18 +1590,9 @@ class QueryTranslator:
         """Handle anomaly detection requests."""
         try:
             # Extract time period and severity from query
-            time_period = "24h"  # default
+            time_period = self._analytics_time_period(parsed_query)
             severity = None
             
-            if parsed_query.time_range:
-                if "week" in parsed_query.original_query.lower():
-                    time_period = "7d"
-                elif "month" in parsed_query.original_query.lower():
-                    time_period = "30d"
-                elif "hour" in parsed_query.original_query.lower():
-                    time_period = "1h"
-            
-            # Extract severity from query
             query_lower = parsed_query.original_query.lower()
             if "critical" in query_lower:
                 severity = "critical"
@@ -1386,14 +1629,7 @@ class QueryTranslator:
         """Handle performance analytics requests."""
         try:
             # Extract time period from query
-            time_period = "24h"  # default
-            if parsed_query.time_range:
-                if "week" in parsed_query.original_query.lower():
-                    time_period = "7d"
-                elif "month" in parsed_query.original_query.lower():
-                    time_period = "30d"
-                elif "hour" in parsed_query.original_query.lower():
-                    time_period = "1h"
+            time_period = self._analytics_time_period(parsed_query)
             
             # Get performance report from analytics service
             performance = summary_service.get_performance_report(db_session, time_period)
@@ -1420,14 +1656,7 @@ class QueryTranslator:
         """Handle metrics analytics requests."""
         try:
             # Extract time period from query
-            time_period = "24h"  # default
-            if parsed_query.time_range:
-                if "week" in parsed_query.original_query.lower():
-                    time_period = "7d"
-                elif "month" in parsed_query.original_query.lower():
-                    time_period = "30d"
-                elif "hour" in parsed_query.original_query.lower():
-                    time_period = "1h"
+            time_period = self._analytics_time_period(parsed_query)
             
             # Get detailed metrics from analytics service
             metrics = summary_service.get_detailed_metrics(time_period)
@@ -1464,6 +1693,21 @@ class QueryTranslator:
             "Detect anomalies in the last hour",
             "What are the critical anomalies today?"
         ]
+    
+    # Map query intents to handler functions (called with the translator as self).
+    # EMERGENCY FIX: analytics intents are served by the existing report, alert
+    # and trend handlers rather than the _handle_analytics_* methods.
+    intent_handlers = MappingProxyType({
+        QueryIntent.SEARCH_LOGS: _handle_search_logs,
+        QueryIntent.SHOW_ALERTS: _handle_show_alerts,
+        QueryIntent.GENERATE_REPORT: _handle_generate_report,
+        QueryIntent.INVESTIGATE: _handle_investigate,
+        QueryIntent.ANALYZE_TRENDS: _handle_analyze_trends,
+        QueryIntent.ANALYTICS_SUMMARY: _handle_generate_report,
+        QueryIntent.ANALYTICS_ANOMALIES: _handle_show_alerts,
+        QueryIntent.ANALYTICS_PERFORMANCE: _handle_analyze_trends,
+        QueryIntent.ANALYTICS_METRICS: _handle_analyze_trends,
+    })
 
 
 # Global translator instance
@@ -70,7 +70,7 @@ class SimpleNLPSystem:
                 }
             
             # Execute the mapped function
-            result = self._execute_function(function_name, parameters, db_session)
+            result = self._execute_function(function_name, parameters, db_session, query)
             
             # Add metadata
             result.update({
@@ -96,7 +96,7 @@ class SimpleNLPSystem:
                 "processing_time_ms": (time.time() - start_time) * 1000
             }
     
-    def _execute_function(self, function_name: str, parameters: Dict[str, Any], db_session) -> Dict[str, Any]:
+    def _execute_function(self, function_name: str, parameters: Dict[str, Any], db_session, query: str = "") -> Dict[str, Any]:
         """Execute the mapped function with parameters."""
         
         try:
@@ -113,8 +113,8 @@ class SimpleNLPSystem:
                     
                     elif function_name == "fetch_all_logs":
                         limit = parameters.get("limit", 1000)
-                        offset = parameters.get("offset", 0)
-                        return func(db_session, limit=limit, offset=offset)
+                        cursor = parameters.get("cursor")
+                        return func(db_session, limit=limit, cursor=cursor)
                     
                     elif function_name == "fetch_logs_by_message_pattern":
                         pattern = parameters.get("pattern", "error")
@@ -136,7 +136,7 @@ class SimpleNLPSystem:
                 
                 elif function_name.startswith('_handle_'):
                     # Handler functions need a ParsedQuery object
-                    parsed_query = self._create_parsed_query(parameters)
+                    parsed_query = self._create_parsed_query(parameters, query)
                     return func(parsed_query, db_session)
                 
                 else:
@@ -159,11 +159,12 @@ class SimpleNLPSystem:
                 "count": 0
             }
     
-    def _create_parsed_query(self, parameters: Dict[str, Any]) -> object:
+    def _create_parsed_query(self, parameters: Dict[str, Any], query: str = "") -> object:
         """Create a minimal ParsedQuery object for handler functions."""
         
         class MockParsedQuery:
-            def __init__(self, params):
+            def __init__(self, params, original_query):
+                self.original_query = original_query
                 self.entities = []
                 self.time_range = None
                 self.parameters = params
@@ -199,8 +200,14 @@ class SimpleNLPSystem:
                         "type": "ip_address", 
                         "value": params["ip_address"]
                     })
+                
+                # Handlers read the range and filters the way they do from a ParsedQuery
+                self.structured_params = {
+                    "time_range": self.time_range,
+                    "filters": {}
+                }
         
-        return MockParsedQuery(parameters)
+        return MockParsedQuery(parameters, query)
     
     def _get_query_suggestions(self) -> list:
         """Get query suggestions for users."""
@@ -0,0 +1,47 @@
+"""
+Tests for the simple NLP system's analytics handlers.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+import db_models  # noqa: F401  (registers the models on Base)
+from database import Base
+from services import simple_nlp_system
+from services.simple_nlp_system import SimpleNLPSystem
+
+
+@pytest.fixture
+def sqlite_session(monkeypatch):
+    """Point the simple NLP system at an empty in-memory SQLite database."""
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        # SQLite can't autoincrement the partitioned table's composite primary key
+        if table.name != "container_logs":
+            table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE container_logs (id INTEGER, timestamp DATETIME, container VARCHAR, "
+            "message TEXT, PRIMARY KEY (id, timestamp))"
+        ))
+    
+    session = Session(engine)
+    monkeypatch.setattr(simple_nlp_system, "get_sync_db_session", lambda: session)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("query, function_name, time_period", [
+    ("system summary", "_handle_analytics_summary", "24h"),
+    ("system summary for the last hour", "_handle_analytics_summary", "1h"),
+    ("show me performance metrics", "_handle_analytics_performance", "24h"),
+])
+def test_analytics_queries_succeed(sqlite_session, query, function_name, time_period):
+    result = SimpleNLPSystem().process_query(query, use_cache=False)
+    
+    assert "error" not in result
+    assert result["success"] is True
+    assert result["function_used"] == function_name
+    assert result["metadata"]["time_period"] == time_period
+    assert result["metadata"]["query"] == query